@@ -1,40 +1,103 @@
-from pydantic_settings import BaseSettings
-from pydantic import field_validator
+import json
+import os
+from dataclasses import dataclass
 from pathlib import Path
 
 
-class Settings(BaseSettings):
-    APP_NAME: str = "GenAI Interview Prep"
-    APP_VERSION: str = "1.0.0"
-    DEBUG: bool = True
+def _read_env_file(path: str = ".env") -> dict[str, str]:
+    """Parse a simple KEY=VALUE .env file; missing file yields an empty dict."""
+    values: dict[str, str] = {}
+    try:
+        lines = Path(path).read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return values
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, _, value = line.removeprefix("export ").partition("=")
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+            value = value[1:-1]
+        values[key.strip()] = value
+    return values
+
+
+# Process environment takes precedence over the .env file
+_ENV = {**_read_env_file(), **os.environ}
+
+
+def _env_str(name: str, default: str) -> str:
+    return _ENV.get(name, default)
+
+
+def _env_int(name: str, default: int) -> int:
+    value = _ENV.get(name)
+    return default if value is None else int(value)
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = _ENV.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _env_list(name: str, default: tuple[str, ...]) -> tuple[str, ...]:
+    """Accept either a JSON list or a comma-separated string."""
+    value = _ENV.get(name)
+    if value is None:
+        return default
+    value = value.strip()
+    if value.startswith("["):
+        return tuple(str(v) for v in json.loads(value))
+    return tuple(s.strip() for s in value.split(",") if s.strip())
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    APP_NAME: str = _env_str("APP_NAME", "GenAI Interview Prep")
+    APP_VERSION: str = _env_str("APP_VERSION", "1.0.0")
+    DEBUG: bool = _env_bool("DEBUG", True)
 
     # Database
-    DATABASE_URL: str = "sqlite+aiosqlite:///./genai_prep.db"
+    DATABASE_URL: str = _env_str("DATABASE_URL", "sqlite+aiosqlite:///./genai_prep.db")
+    DB_POOL_SIZE: int = _env_int("DB_POOL_SIZE", 5)
+    DB_MAX_OVERFLOW: int = _env_int("DB_MAX_OVERFLOW", 10)
 
     # CORS
-    ALLOWED_ORIGINS: list[str] = [
-        "http://localhost:3000",
-        "http://127.0.0.1:3000",
-    ]
-
-    @field_validator("ALLOWED_ORIGINS", mode="before")
-    @classmethod
-    def parse_origins(cls, v):
-        if isinstance(v, str):
-            return [s.strip() for s in v.split(",") if s.strip()]
-        return v
+    ALLOWED_ORIGINS: tuple[str, ...] = _env_list(
+        "ALLOWED_ORIGINS",
+        ("http://localhost:3000", "http://127.0.0.1:3000"),
+    )
 
     # Content
-    GENAI_JSON_PATH: str = str(
-        Path(__file__).parent.parent.parent / "genai.json"
+    GENAI_JSON_PATH: str = _env_str(
+        "GENAI_JSON_PATH",
+        str(Path(__file__).parent.parent.parent / "genai.json"),
+    )
+    # Indexed-content cache; kept apart from the content directory, which may be shared
+    CONTENT_CACHE_DIR: str = _env_str(
+        "CONTENT_CACHE_DIR",
+        str(Path(__file__).parent.parent / ".cache"),
     )
 
-    # Encryption key for API keys at rest (generate a real one in production)
-    ENCRYPTION_KEY: str = "default-dev-key-change-in-production-32b"
+    # LLM calls issued concurrently by one request fan-out (e.g. AI quiz batches)
+    MAX_CONCURRENT_LLM: int = _env_int("MAX_CONCURRENT_LLM", 4)
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    # Streamed interviewer replies are sent in chunks of up to SSE_BATCH_TOKENS tokens,
+    # flushed early once SSE_BATCH_MS milliseconds have passed since the last send
+    SSE_BATCH_TOKENS: int = _env_int("SSE_BATCH_TOKENS", 8)
+    SSE_BATCH_MS: int = _env_int("SSE_BATCH_MS", 50)
+
+    # Active mock interviews kept in memory, and seconds of inactivity before one expires
+    MAX_INTERVIEW_SESSIONS: int = _env_int("MAX_INTERVIEW_SESSIONS", 256)
+    INTERVIEW_SESSION_TTL: int = _env_int("INTERVIEW_SESSION_TTL", 3600)
+
+    # Encryption key for API keys at rest (generate a real one in production)
+    ENCRYPTION_KEY: str = _env_str(
+        "ENCRYPTION_KEY", "default-dev-key-change-in-production-32b"
+    )
 
 
 settings = Settings()
@@ -1,11 +1,64 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import asyncio
+import warnings
+
+import orjson
+from sqlalchemy import bindparam, delete, event, func, inspect, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.schema import CreateColumn, CreateIndex
 
 from app.config import settings
 
-engine = create_async_engine(settings.DATABASE_URL, echo=settings.DEBUG)
+
+def _pool_options(url: str) -> dict:
+    """Sized async queue pool; in-memory SQLite keeps its single static connection."""
+    if ":memory:" in url:
+        return {}
+    options = {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+    }
+    if not url.startswith("sqlite"):
+        # Server connections can drop while idle; a local SQLite file can't
+        options["pool_pre_ping"] = True
+    return options
+
+
+# JSON columns are encoded with orjson; SQLite stores them as TEXT, hence the decode
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    echo=settings.DEBUG,
+    json_serializer=lambda obj: orjson.dumps(obj).decode(),
+    json_deserializer=orjson.loads,
+    **_pool_options(settings.DATABASE_URL),
+)
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+# INSERT ... ON CONFLICT DO UPDATE needs a dialect-specific insert(); SQLite's and
+# PostgreSQL's share the on_conflict_do_update API the routers use
+if engine.dialect.name == "sqlite":
+    from sqlalchemy.dialects.sqlite import insert as upsert_insert
+elif engine.dialect.name == "postgresql":
+    from sqlalchemy.dialects.postgresql import insert as upsert_insert
+else:
+    raise RuntimeError(
+        f"Unsupported database '{engine.dialect.name}': DATABASE_URL must point to SQLite or PostgreSQL"
+    )
+
+
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, _):
+        """WAL lets readers run during writes; NORMAL sync is durable enough under WAL."""
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
+
 
 class Base(DeclarativeBase):
     pass
@@ -22,5 +75,123 @@ async def get_db() -> AsyncSession:
 
 
 async def init_db():
+    from app.models.quiz_attempt import QuizSessionSummary, quiz_summary_backfill
+
     async with engine.begin() as conn:
+        had_summaries = await conn.run_sync(
+            lambda sync_conn: inspect(sync_conn).has_table(QuizSessionSummary.__tablename__)
+        )
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_add_missing_columns)
+        await conn.run_sync(_create_missing_indexes)
+        if not had_summaries:
+            # Summaries are maintained on submit; derive them once for pre-existing attempts
+            await conn.execute(quiz_summary_backfill())
+        if engine.dialect.name == "sqlite":
+            await _init_sqlite_fts(conn)
+
+
+async def prewarm_pool():
+    """Open the pool's connections up front so early requests skip connection setup.
+
+    Each connection runs SELECT 1, doubling as a startup health check.
+    """
+    if not isinstance(engine.pool, AsyncAdaptedQueuePool):
+        return
+
+    async def _check():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    # All checked out at once, so each task gets its own connection
+    await asyncio.gather(*(_check() for _ in range(engine.pool.size())))
+
+
+def _add_missing_columns(sync_conn):
+    """create_all skips existing tables, so add nullable columns introduced later."""
+    inspector = inspect(sync_conn)
+    for table in Base.metadata.sorted_tables:
+        existing = {c["name"] for c in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in existing and column.nullable:
+                ddl = CreateColumn(column).compile(dialect=sync_conn.dialect)
+                sync_conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {ddl}"))
+
+
+# Indexes superseded by composite, unique or renamed replacements in the models
+_OBSOLETE_INDEXES = (
+    "ix_progress_item_id",
+    "ix_progress_section",
+    "ix_notes_item_id",
+    "ix_quiz_attempts_session_id",
+    "ix_quiz_session_summaries_created",
+)
+
+
+def _create_missing_indexes(sync_conn):
+    """create_all skips existing tables, so add indexes introduced after a table was created."""
+    for name in _OBSOLETE_INDEXES:
+        sync_conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+    inspector = inspect(sync_conn)
+    # IF NOT EXISTS rather than checkfirst: reflection can't see expression indexes
+    for table in Base.metadata.sorted_tables:
+        with warnings.catch_warnings():
+            # Only named plain-column unique indexes are looked up below
+            warnings.filterwarnings("ignore", "Skipped unsupported reflection of expression-based index")
+            existing = {ix["name"] for ix in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.unique and index.name not in existing:
+                _set_aside_duplicates(sync_conn, index)
+            sync_conn.execute(CreateIndex(index, if_not_exists=True))
+
+
+def _set_aside_duplicates(sync_conn, index):
+    """Move rows that would violate a new unique index into a backup table.
+
+    Tables created before the index existed may hold duplicates written by
+    concurrent requests, which would make CREATE UNIQUE INDEX fail at startup.
+    The newest row per key stays; the others are copied to
+    `<index name>_duplicates` before being deleted, so nothing is lost.
+    """
+    if not index.columns or len(index.columns) != len(index.expressions):
+        raise RuntimeError(
+            f"Cannot create unique index {index.name} on an existing table: "
+            "duplicate detection supports plain-column indexes only"
+        )
+    table = index.table
+    newest = table.c.updated_at if "updated_at" in table.c else table.c.id
+    ranked = select(
+        table.c.id,
+        func.row_number().over(
+            partition_by=list(index.columns), order_by=(newest.desc(), table.c.id.desc())
+        ).label("rank"),
+    ).subquery()
+    ids = sync_conn.execute(select(ranked.c.id).where(ranked.c.rank > 1)).scalars().all()
+    if not ids:
+        return
+
+    backup = f"{index.name}_duplicates"
+    sync_conn.execute(text(f"CREATE TABLE IF NOT EXISTS {backup} AS SELECT * FROM {table.name} WHERE 1 = 0"))
+    sync_conn.execute(
+        text(f"INSERT INTO {backup} SELECT * FROM {table.name} WHERE id IN :ids")
+        .bindparams(bindparam("ids", expanding=True)),
+        {"ids": ids},
+    )
+    sync_conn.execute(delete(table).where(table.c.id.in_(ids)))
+    print(
+        f"WARNING: {len(ids)} {table.name} rows duplicated a newer row's "
+        f"{', '.join(c.name for c in index.columns)} and were moved to table {backup} "
+        f"before creating {index.name} (ids: {', '.join(map(str, ids))})"
+    )
+
+
+async def _init_sqlite_fts(conn: AsyncConnection):
+    """Create the FTS5 shadow table for note search and backfill it on first creation."""
+    from app.models.note import NOTES_FTS_DDL, NOTES_FTS_REBUILD
+
+    result = await conn.execute(text("SELECT 1 FROM sqlite_master WHERE name = 'notes_fts'"))
+    exists = result.first() is not None
+    for ddl in NOTES_FTS_DDL:
+        await conn.execute(text(ddl))
+    if not exists:
+        await conn.execute(text(NOTES_FTS_REBUILD))
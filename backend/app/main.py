@@ -5,9 +5,10 @@ GenAI Interview Prep — FastAPI Application
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.config import settings
-from app.database import init_db
+from app.database import engine, init_db, prewarm_pool
 from app.services.content_loader import content_loader
 from app.routers import content, quiz, progress, notes, study_plan, interview, settings as settings_router
 
@@ -20,18 +21,20 @@ async def lifespan(app: FastAPI):
 
     # Initialize database
     await init_db()
+    await prewarm_pool()
     print("Database initialized")
 
     # Load content from genai.json
     content_loader.load()
-    print(f"Loaded {len(content_loader.all_items)} content items from genai.json")
-    print(f"Generated {len(content_loader.all_flashcards)} flashcards")
+    print(f"Loaded {content_loader.total_items} content items from genai.json")
+    print(f"Generated {content_loader.total_flashcards} flashcards")
     print(f"Indexed {len(content_loader.sections)} sections")
 
     yield
 
     # Shutdown
     print("Shutting down...")
+    await engine.dispose()
 
 
 app = FastAPI(
@@ -39,15 +42,17 @@ app = FastAPI(
     version=settings.APP_VERSION,
     description="A comprehensive interview preparation platform for Senior Python GenAI Engineers",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# CORS middleware
+# CORS middleware — explicit method/header lists let Starlette build the
+# preflight response headers once instead of echoing the request per preflight
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization", "X-Requested-With"],
 )
 
 # Include routers
@@ -74,7 +79,7 @@ async def root():
 async def health():
     return {
         "status": "healthy",
-        "content_loaded": len(content_loader.all_items) > 0,
-        "total_items": len(content_loader.all_items),
+        "content_loaded": content_loader.total_items > 0,
+        "total_items": content_loader.total_items,
         "total_sections": len(content_loader.sections),
     }
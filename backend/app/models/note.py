@@ -1,5 +1,5 @@
 import datetime
-from sqlalchemy import String, Text, Boolean, DateTime, func
+from sqlalchemy import String, Text, Boolean, DateTime, Index, column, func, table
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -9,7 +9,7 @@ class Note(Base):
     __tablename__ = "notes"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    item_id: Mapped[str] = mapped_column(String(200), index=True)
+    item_id: Mapped[str] = mapped_column(String(200))
     section: Mapped[str] = mapped_column(String(100), index=True)
     content: Mapped[str | None] = mapped_column(Text, nullable=True)
     is_bookmarked: Mapped[bool] = mapped_column(Boolean, default=False)
@@ -19,3 +19,32 @@ class Note(Base):
     updated_at: Mapped[datetime.datetime] = mapped_column(
         DateTime, server_default=func.now(), onupdate=func.now()
     )
+
+
+# One note per item; also the conflict target for the notes router's upserts
+Index("uq_notes_item_id", Note.item_id, unique=True)
+# Covers the list_notes filters (section, bookmarked) and its updated_at DESC ordering
+Index("ix_notes_section_bm_updated", Note.section, Note.is_bookmarked, Note.updated_at.desc())
+
+
+# SQLite FTS5 shadow index over notes.content, kept in sync by triggers.
+# The trigram tokenizer preserves the substring semantics of the old ILIKE search.
+notes_fts = table("notes_fts", column("rowid"), column("notes_fts"))
+
+NOTES_FTS_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5(
+        content, content='notes', content_rowid='id', tokenize='trigram'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS notes_fts_ai AFTER INSERT ON notes BEGIN
+        INSERT INTO notes_fts(rowid, content) VALUES (new.id, new.content);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS notes_fts_ad AFTER DELETE ON notes BEGIN
+        INSERT INTO notes_fts(notes_fts, rowid, content) VALUES ('delete', old.id, old.content);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS notes_fts_au AFTER UPDATE OF content ON notes BEGIN
+        INSERT INTO notes_fts(notes_fts, rowid, content) VALUES ('delete', old.id, old.content);
+        INSERT INTO notes_fts(rowid, content) VALUES (new.id, new.content);
+    END""",
+]
+
+NOTES_FTS_REBUILD = "INSERT INTO notes_fts(notes_fts) VALUES ('rebuild')"
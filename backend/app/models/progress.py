@@ -1,5 +1,5 @@
 import datetime
-from sqlalchemy import String, Integer, DateTime, Float, func
+from sqlalchemy import String, Integer, DateTime, Float, Index, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -7,10 +7,12 @@ from app.database import Base
 
 class Progress(Base):
     __tablename__ = "progress"
+    # Fetch server-generated timestamps via RETURNING during flush, no refresh needed
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    item_id: Mapped[str] = mapped_column(String(200), index=True)  # e.g. "research_papers:1"
-    section: Mapped[str] = mapped_column(String(100), index=True)  # e.g. "research_papers"
+    item_id: Mapped[str] = mapped_column(String(200))  # e.g. "research_papers:1"
+    section: Mapped[str] = mapped_column(String(100))  # e.g. "research_papers"
     status: Mapped[str] = mapped_column(String(20), default="not_started")  # not_started, in_progress, completed
     confidence: Mapped[int] = mapped_column(Integer, default=0)  # 0-5 scale
     times_reviewed: Mapped[int] = mapped_column(Integer, default=0)
@@ -22,3 +24,16 @@ class Progress(Base):
     updated_at: Mapped[datetime.datetime] = mapped_column(
         DateTime, server_default=func.now(), onupdate=func.now()
     )
+
+
+# One progress row per item; also the conflict target for the progress upserts
+Index("uq_progress_item_id", Progress.item_id, unique=True)
+# Keyset pagination of list_progress filtered by section or status, newest first
+Index("ix_progress_section_updated", Progress.section, Progress.updated_at.desc(), Progress.id.desc())
+Index("ix_progress_status_updated", Progress.status, Progress.updated_at.desc(), Progress.id.desc())
+# Unfiltered list_progress ordering
+Index("ix_progress_updated", Progress.updated_at.desc(), Progress.id.desc())
+# Covers the overview's GROUP BY section, status with its confidence sum
+Index("ix_progress_section_status", Progress.section, Progress.status, Progress.confidence)
+# Distinct activity days for days_active and the streak
+Index("ix_progress_updated_date", func.date(Progress.updated_at))
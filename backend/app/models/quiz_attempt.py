@@ -1,5 +1,5 @@
 import datetime
-from sqlalchemy import String, Text, Boolean, Integer, Float, DateTime, func
+from sqlalchemy import JSON, String, Text, Boolean, Integer, Float, DateTime, Index, case, func, insert, select
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -9,11 +9,11 @@ class QuizAttempt(Base):
     __tablename__ = "quiz_attempts"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    session_id: Mapped[str] = mapped_column(String(100), index=True)  # groups questions per quiz session
+    session_id: Mapped[str] = mapped_column(String(100))  # groups questions per quiz session
     section: Mapped[str] = mapped_column(String(100))
     topic: Mapped[str | None] = mapped_column(String(200), nullable=True)
     question: Mapped[str] = mapped_column(Text)
-    options: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON string of options
+    options: Mapped[list[str] | None] = mapped_column(JSON(none_as_null=True), nullable=True)  # list of option strings
     selected_answer: Mapped[str | None] = mapped_column(Text, nullable=True)
     correct_answer: Mapped[str] = mapped_column(Text)
     is_correct: Mapped[bool | None] = mapped_column(Boolean, nullable=True)
@@ -26,6 +26,59 @@ class QuizAttempt(Base):
     )
 
 
+# Matches the GROUP BY of the quiz history query
+Index("ix_quiz_attempts_session_section_topic", QuizAttempt.session_id, QuizAttempt.section, QuizAttempt.topic)
+
+
+class QuizSessionSummary(Base):
+    """Per-session quiz totals, maintained on submit so history needs no GROUP BY."""
+
+    __tablename__ = "quiz_session_summaries"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    session_id: Mapped[str] = mapped_column(String(100))
+    section: Mapped[str] = mapped_column(String(100))
+    topic: Mapped[str] = mapped_column(String(200), default="")  # "" for no topic, keeping the unique key NULL-free
+    total_questions: Mapped[int] = mapped_column(Integer, default=0)
+    correct_answers: Mapped[int] = mapped_column(Integer, default=0)
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime, server_default=func.now()
+    )
+
+
+# Conflict target for the submit upsert; same grouping the history used to compute
+Index(
+    "uq_quiz_session_summaries_key",
+    QuizSessionSummary.session_id,
+    QuizSessionSummary.section,
+    QuizSessionSummary.topic,
+    unique=True,
+)
+# Keyset pagination of the history, newest first
+Index(
+    "ix_quiz_session_summaries_created_id",
+    QuizSessionSummary.created_at.desc(),
+    QuizSessionSummary.session_id.desc(),
+    QuizSessionSummary.id.desc(),
+)
+
+
+def quiz_summary_backfill():
+    """INSERT ... SELECT rebuilding summaries from existing attempts."""
+    topic = func.coalesce(QuizAttempt.topic, "")
+    return insert(QuizSessionSummary).from_select(
+        ["session_id", "section", "topic", "total_questions", "correct_answers", "created_at"],
+        select(
+            QuizAttempt.session_id,
+            QuizAttempt.section,
+            topic,
+            func.count(QuizAttempt.id),
+            func.sum(case((QuizAttempt.is_correct, 1), else_=0)),
+            func.min(QuizAttempt.created_at),
+        ).group_by(QuizAttempt.session_id, QuizAttempt.section, topic),
+    )
+
+
 class InterviewSession(Base):
     __tablename__ = "interview_sessions"
 
@@ -7,6 +7,8 @@ from app.database import Base
 
 class User(Base):
     __tablename__ = "users"
+    # Fetch server-generated timestamps via RETURNING during flush, no refresh needed
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     username: Mapped[str] = mapped_column(String(100), unique=True, default="default")
@@ -15,6 +17,10 @@ class User(Base):
     gemini_api_key: Mapped[str | None] = mapped_column(Text, nullable=True)
     openai_api_key: Mapped[str | None] = mapped_column(Text, nullable=True)
     anthropic_api_key: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Masked previews written alongside the ciphertext, so reads need no decryption
+    gemini_api_key_preview: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    openai_api_key_preview: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    anthropic_api_key_preview: Mapped[str | None] = mapped_column(String(20), nullable=True)
     ollama_base_url: Mapped[str | None] = mapped_column(String(500), nullable=True, default="http://localhost:11434")
 
     preferred_provider: Mapped[str | None] = mapped_column(String(50), nullable=True, default="gemini")
@@ -2,14 +2,13 @@
 Interview router — AI-powered mock interviews with SSE streaming.
 """
 
-import json
-from datetime import datetime
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, update, func
 
-from app.database import get_db
+from app.database import async_session, get_db
 from app.models.quiz_attempt import InterviewSession
 from app.schemas.schemas import (
     InterviewStartRequest,
@@ -28,13 +27,45 @@ from app.services.interview_engine import (
     get_interviewer_response,
     stream_interviewer_response,
     evaluate_interview,
+    stream_evaluate_interview,
     get_session_messages,
     cleanup_session,
 )
 from app.services.llm_service import test_connection
+from app.utils.streaming import stream_json_array
 
 router = APIRouter(prefix="/api/interview", tags=["Interview"])
 
+# SSE frames are emitted as bytes; variable frames are spliced around the
+# orjson-encoded value instead of building and encoding a dict per frame.
+_TOKEN_PREFIX = b'data: {"type":"token","content":'
+_SESSION_ID_PREFIX = b'data: {"type":"session_id","content":'
+_FRAME_SUFFIX = b"}\n\n"
+
+
+def _sse_event(payload: dict) -> bytes:
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
+def _sse_token(token: str) -> bytes:
+    return _TOKEN_PREFIX + orjson.dumps(token) + _FRAME_SUFFIX
+
+
+def _sse_session_id(session_id: str) -> bytes:
+    return _SESSION_ID_PREFIX + orjson.dumps(session_id) + _FRAME_SUFFIX
+
+
+_DONE_FRAME = _sse_event({"type": "done", "content": ""})
+_DONE_FRAMES_BY_STATUS = {
+    status: _sse_event({"type": "done", "content": "", "status": status})
+    for status in ("active", "completed")
+}
+
+
+def _sse_done(status: str) -> bytes:
+    frame = _DONE_FRAMES_BY_STATUS.get(status)
+    return frame if frame is not None else _sse_event({"type": "done", "content": "", "status": status})
+
 
 @router.post("/test-connection")
 async def test_llm_connection(request: TestConnectionRequest):
@@ -56,14 +87,13 @@ async def start_interview_session(
     )
 
     # Save to DB
-    db_session = InterviewSession(
+    await db.execute(insert(InterviewSession).values(
         session_id=session["session_id"],
         interview_type=request.interview_type,
         provider=request.llm_config.provider,
         model=request.llm_config.model,
         status="active",
-    )
-    db.add(db_session)
+    ))
 
     # Get interviewer's opening message
     opening = await start_interview(session["session_id"], request.llm_config)
@@ -88,24 +118,22 @@ async def start_interview_stream(
         num_questions=request.num_questions,
     )
 
-    db_session = InterviewSession(
+    await db.execute(insert(InterviewSession).values(
         session_id=session["session_id"],
         interview_type=request.interview_type,
         provider=request.llm_config.provider,
         model=request.llm_config.model,
         status="active",
-    )
-    db.add(db_session)
-    await db.flush()
+    ))
 
     async def event_generator():
         # First send the session_id
-        yield f"data: {json.dumps({'type': 'session_id', 'content': session['session_id']})}\n\n"
+        yield _sse_session_id(session["session_id"])
 
         async for token in stream_start_interview(session["session_id"], request.llm_config):
-            yield f"data: {json.dumps({'type': 'token', 'content': token})}\n\n"
+            yield _sse_token(token)
 
-        yield f"data: {json.dumps({'type': 'done', 'content': ''})}\n\n"
+        yield _DONE_FRAME
 
     return StreamingResponse(
         event_generator(),
@@ -147,12 +175,12 @@ async def send_message_stream(request: InterviewMessageRequest):
         async for token in stream_interviewer_response(
             request.session_id, request.message, request.llm_config
         ):
-            yield f"data: {json.dumps({'type': 'token', 'content': token})}\n\n"
+            yield _sse_token(token)
 
         # Send final status
         updated_session = get_session(request.session_id)
         status = updated_session.get("status", "active") if updated_session else "active"
-        yield f"data: {json.dumps({'type': 'done', 'content': '', 'status': status})}\n\n"
+        yield _sse_done(status)
 
     return StreamingResponse(
         event_generator(),
@@ -176,49 +204,81 @@ async def evaluate_interview_session(
         raise HTTPException(status_code=404, detail="Interview session not found")
 
     evaluation = await evaluate_interview(request.session_id, request.llm_config)
-
-    # Update DB
-    stmt = select(InterviewSession).where(InterviewSession.session_id == request.session_id)
-    result = await db.execute(stmt)
-    db_session = result.scalar_one_or_none()
-    if db_session:
-        db_session.status = "completed"
-        db_session.completed_at = datetime.utcnow()
-        db_session.evaluation = json.dumps(evaluation.model_dump())
-        db_session.score = evaluation.overall_score
-        messages = get_session_messages(request.session_id)
-        db_session.messages = json.dumps(messages)
+    evaluation_data = evaluation.model_dump()
+    await _save_evaluation(db, request.session_id, evaluation_data)
 
     return {
         "session_id": request.session_id,
-        "evaluation": evaluation.model_dump(),
+        "evaluation": evaluation_data,
     }
 
 
+@router.post("/evaluate-stream")
+async def evaluate_interview_stream(request: InterviewEndRequest):
+    """Evaluate a completed interview, streaming each report field via SSE as it completes."""
+    session = get_session(request.session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Interview session not found")
+
+    async def event_generator():
+        async for field, value in stream_evaluate_interview(request.session_id, request.llm_config):
+            if field != "evaluation":
+                yield _sse_event({"type": "field", "field": field, "content": value})
+                continue
+            evaluation_data = value.model_dump()
+            # The request-scoped session is closed before the body streams
+            async with async_session() as db:
+                await _save_evaluation(db, request.session_id, evaluation_data)
+                await db.commit()
+            yield _sse_event({"type": "evaluation", "content": evaluation_data})
+
+        yield _DONE_FRAME
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+async def _save_evaluation(db: AsyncSession, session_id: str, evaluation_data: dict):
+    # Update DB in a single statement; a missing row simply matches nothing
+    await db.execute(
+        update(InterviewSession)
+        .where(InterviewSession.session_id == session_id)
+        .values(
+            status="completed",
+            completed_at=func.now(),
+            evaluation=orjson.dumps(evaluation_data).decode(),
+            score=evaluation_data["overall_score"],
+            messages=orjson.dumps(get_session_messages(session_id)).decode(),
+        )
+    )
+
+
 @router.get("/sessions")
-async def list_sessions(db: AsyncSession = Depends(get_db)):
+async def list_sessions():
     """List all interview sessions."""
+    # Select only the listed columns; messages/evaluation can be large and aren't returned
     stmt = (
-        select(InterviewSession)
+        select(
+            InterviewSession.session_id,
+            InterviewSession.interview_type,
+            InterviewSession.provider,
+            InterviewSession.model,
+            InterviewSession.status,
+            InterviewSession.score,
+            InterviewSession.created_at,
+            InterviewSession.completed_at,
+        )
         .order_by(InterviewSession.created_at.desc())
         .limit(20)
     )
-    result = await db.execute(stmt)
-    sessions = result.scalars().all()
-
-    return [
-        {
-            "session_id": s.session_id,
-            "interview_type": s.interview_type,
-            "provider": s.provider,
-            "model": s.model,
-            "status": s.status,
-            "score": s.score,
-            "created_at": s.created_at.isoformat() if s.created_at else None,
-            "completed_at": s.completed_at.isoformat() if s.completed_at else None,
-        }
-        for s in sessions
-    ]
+    return stream_json_array(stmt, lambda row: row._asdict(), scalars=False)
 
 
 @router.get("/sessions/{session_id}")
@@ -230,15 +290,16 @@ async def get_session_detail(session_id: str, db: AsyncSession = Depends(get_db)
     if not db_session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    return {
+    # orjson encodes the datetimes natively; returning the response skips jsonable_encoder
+    return ORJSONResponse({
         "session_id": db_session.session_id,
         "interview_type": db_session.interview_type,
         "provider": db_session.provider,
         "model": db_session.model,
         "status": db_session.status,
         "score": db_session.score,
-        "messages": json.loads(db_session.messages) if db_session.messages else [],
-        "evaluation": json.loads(db_session.evaluation) if db_session.evaluation else None,
-        "created_at": db_session.created_at.isoformat() if db_session.created_at else None,
-        "completed_at": db_session.completed_at.isoformat() if db_session.completed_at else None,
-    }
+        "messages": orjson.loads(db_session.messages) if db_session.messages else [],
+        "evaluation": orjson.loads(db_session.evaluation) if db_session.evaluation else None,
+        "created_at": db_session.created_at,
+        "completed_at": db_session.completed_at,
+    })
@@ -4,15 +4,28 @@ Notes router — CRUD for personal notes and bookmarks on any content item.
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, delete, func, not_
 
-from app.database import get_db
-from app.models.note import Note
+from app.database import get_db, upsert_insert
+from app.models.note import Note, notes_fts
 from app.schemas.schemas import NoteCreate, NoteUpdate, NoteResponse
+from app.utils.streaming import stream_json_array
 
 router = APIRouter(prefix="/api/notes", tags=["Notes"])
 
 
+def _note_dict(note: Note) -> dict:
+    return {
+        "id": note.id,
+        "item_id": note.item_id,
+        "section": note.section,
+        "content": note.content,
+        "is_bookmarked": note.is_bookmarked,
+        "created_at": note.created_at,
+        "updated_at": note.updated_at,
+    }
+
+
 @router.get("/", response_model=list[NoteResponse])
 async def list_notes(
     section: str | None = Query(None),
@@ -27,11 +40,17 @@ async def list_notes(
     if bookmarked_only:
         stmt = stmt.where(Note.is_bookmarked == True)
     if search:
-        stmt = stmt.where(Note.content.ilike(f"%{search}%"))
+        # The FTS5 trigram index needs at least 3 characters to match
+        if db.get_bind().dialect.name == "sqlite" and len(search) >= 3:
+            phrase = '"' + search.replace('"', '""') + '"'
+            stmt = stmt.join(notes_fts, Note.id == notes_fts.c.rowid).where(
+                notes_fts.c.notes_fts.match(phrase)
+            )
+        else:
+            stmt = stmt.where(Note.content.ilike(f"%{search}%"))
     stmt = stmt.order_by(Note.updated_at.desc())
 
-    result = await db.execute(stmt)
-    return result.scalars().all()
+    return stream_json_array(stmt, _note_dict)
 
 
 @router.get("/{item_id:path}", response_model=NoteResponse)
@@ -48,77 +67,69 @@ async def get_note(item_id: str, db: AsyncSession = Depends(get_db)):
 @router.post("/", response_model=NoteResponse)
 async def create_or_update_note(data: NoteCreate, db: AsyncSession = Depends(get_db)):
     """Create or update a note for an item."""
-    stmt = select(Note).where(Note.item_id == data.item_id)
+    stmt = upsert_insert(Note).values(
+        item_id=data.item_id,
+        section=data.section,
+        content=data.content,
+        is_bookmarked=data.is_bookmarked,
+    )
+    # ON CONFLICT DO UPDATE ignores Column.onupdate, so bump updated_at explicitly
+    set_ = {"is_bookmarked": stmt.excluded.is_bookmarked, "updated_at": func.now()}
+    if data.content is not None:
+        set_["content"] = stmt.excluded.content
+    stmt = (
+        stmt.on_conflict_do_update(index_elements=[Note.item_id], set_=set_)
+        .returning(Note)
+        .execution_options(populate_existing=True)
+    )
     result = await db.execute(stmt)
-    note = result.scalar_one_or_none()
-
-    if note:
-        if data.content is not None:
-            note.content = data.content
-        note.is_bookmarked = data.is_bookmarked
-    else:
-        note = Note(
-            item_id=data.item_id,
-            section=data.section,
-            content=data.content,
-            is_bookmarked=data.is_bookmarked,
-        )
-        db.add(note)
-
-    await db.flush()
-    await db.refresh(note)
-    return note
+    return result.scalar_one()
 
 
 @router.patch("/{item_id:path}", response_model=NoteResponse)
 async def update_note(item_id: str, data: NoteUpdate, db: AsyncSession = Depends(get_db)):
     """Partially update a note."""
-    stmt = select(Note).where(Note.item_id == item_id)
+    values = data.model_dump(exclude_none=True)
+    if values:
+        # UPDATE ... RETURNING: a missing row yields nothing, so no prior SELECT
+        stmt = (
+            update(Note)
+            .where(Note.item_id == item_id)
+            .values(**values)
+            .returning(Note)
+            .execution_options(populate_existing=True)
+        )
+    else:
+        stmt = select(Note).where(Note.item_id == item_id)
     result = await db.execute(stmt)
     note = result.scalar_one_or_none()
     if not note:
         raise HTTPException(status_code=404, detail=f"No note found for '{item_id}'")
-
-    if data.content is not None:
-        note.content = data.content
-    if data.is_bookmarked is not None:
-        note.is_bookmarked = data.is_bookmarked
-
-    await db.flush()
-    await db.refresh(note)
     return note
 
 
 @router.delete("/{item_id:path}")
 async def delete_note(item_id: str, db: AsyncSession = Depends(get_db)):
     """Delete a note."""
-    stmt = select(Note).where(Note.item_id == item_id)
+    stmt = delete(Note).where(Note.item_id == item_id).returning(Note.id)
     result = await db.execute(stmt)
-    note = result.scalar_one_or_none()
-    if not note:
+    if result.first() is None:
         raise HTTPException(status_code=404, detail=f"No note found for '{item_id}'")
 
-    await db.delete(note)
     return {"status": "deleted", "item_id": item_id}
 
 
 @router.post("/bookmark/{item_id:path}", response_model=NoteResponse)
 async def toggle_bookmark(item_id: str, section: str = Query(...), db: AsyncSession = Depends(get_db)):
     """Toggle bookmark status for an item."""
-    stmt = select(Note).where(Note.item_id == item_id)
-    result = await db.execute(stmt)
-    note = result.scalar_one_or_none()
-
-    if note:
-        note.is_bookmarked = not note.is_bookmarked
-    else:
-        note = Note(
-            item_id=item_id,
-            section=section,
-            is_bookmarked=True,
+    stmt = upsert_insert(Note).values(item_id=item_id, section=section, is_bookmarked=True)
+    stmt = (
+        stmt.on_conflict_do_update(
+            index_elements=[Note.item_id],
+            set_={"is_bookmarked": not_(Note.is_bookmarked), "updated_at": func.now()},
         )
-        db.add(note)
-
-    await db.flush()
-    await db.refresh(note)
-    return note
+        .returning(Note)
+        .execution_options(populate_existing=True)
+    )
+    result = await db.execute(stmt)
+    return result.scalar_one()
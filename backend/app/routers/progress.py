@@ -2,21 +2,24 @@
 Progress router — CRUD for tracking learning progress across all content items.
 """
 
-from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends, HTTPException, Query
+from datetime import date, datetime, timedelta
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, case
+from sqlalchemy import select, update, func, case, tuple_
 
-from app.database import get_db
+from app.database import get_db, upsert_insert
 from app.models.progress import Progress
 from app.schemas.schemas import (
     ProgressCreate,
     ProgressUpdate,
     ProgressResponse,
+    ProgressPage,
     SectionProgress,
     OverallProgress,
 )
+from app.services import progress_cache
 from app.services.content_loader import content_loader
+from app.utils.pagination import decode_cursor, encode_cursor
 
 router = APIRouter(prefix="/api/progress", tags=["Progress"])
 
@@ -24,38 +27,54 @@ router = APIRouter(prefix="/api/progress", tags=["Progress"])
 @router.get("/overview", response_model=OverallProgress)
 async def get_progress_overview(db: AsyncSession = Depends(get_db)):
     """Get overall progress across all sections."""
-    total_items = len(content_loader.all_items)
+    # The streak depends on today's date, so it is part of the cache key
+    today = datetime.utcnow().date()
+    cache_key = f"overview:{today}"
+    cached = progress_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+    version = progress_cache.current_version()
+
+    total_items = content_loader.total_items
 
-    # Get progress stats from DB
+    # One round-trip: grouped stats per (section, status), with days_active and
+    # the current streak attached as scalar subquery columns
+    days_active_col, streak_col = _activity_columns(today)
     stmt = select(
-        func.count(Progress.id).label("total_tracked"),
-        func.sum(case((Progress.status == "completed", 1), else_=0)).label("completed"),
-        func.sum(case((Progress.status == "in_progress", 1), else_=0)).label("in_progress"),
-        func.avg(Progress.confidence).label("avg_confidence"),
-    )
+        Progress.section,
+        Progress.status,
+        func.count(Progress.id),
+        func.sum(Progress.confidence),
+        days_active_col.label("days_active"),
+        streak_col.label("streak"),
+    ).group_by(Progress.section, Progress.status)
     result = await db.execute(stmt)
-    row = result.first()
-
-    completed = int(row.completed or 0)
-    in_progress = int(row.in_progress or 0)
-    avg_confidence = float(row.avg_confidence or 0)
+    rows = result.all()
+
+    by_section: dict[str, dict[str, int]] = {}
+    tracked = confidence_sum = 0
+    for section, status, count, conf_sum, _, _ in rows:
+        stats = by_section.setdefault(section, {"total": 0, "confidence": 0})
+        stats[status] = stats.get(status, 0) + count
+        stats["total"] += count
+        stats["confidence"] += conf_sum or 0
+        tracked += count
+        confidence_sum += conf_sum or 0
+
+    completed = sum(stats.get("completed", 0) for stats in by_section.values())
+    in_progress = sum(stats.get("in_progress", 0) for stats in by_section.values())
+    avg_confidence = confidence_sum / tracked if tracked else 0.0
     not_started = total_items - completed - in_progress
 
     # Per-section stats
     sections = []
+    empty = {"total": 0, "confidence": 0}
     for sec in content_loader.sections:
-        sec_stmt = select(
-            func.count(Progress.id).label("total"),
-            func.sum(case((Progress.status == "completed", 1), else_=0)).label("completed"),
-            func.sum(case((Progress.status == "in_progress", 1), else_=0)).label("in_progress"),
-            func.avg(Progress.confidence).label("avg_confidence"),
-        ).where(Progress.section == sec.section_key)
-        sec_result = await db.execute(sec_stmt)
-        sec_row = sec_result.first()
-
-        sec_completed = int(sec_row.completed or 0)
-        sec_in_progress = int(sec_row.in_progress or 0)
+        stats = by_section.get(sec.section_key, empty)
+        sec_completed = stats.get("completed", 0)
+        sec_in_progress = stats.get("in_progress", 0)
         sec_not_started = sec.item_count - sec_completed - sec_in_progress
+        sec_avg = stats["confidence"] / stats["total"] if stats["total"] else 0.0
 
         sections.append(SectionProgress(
             section=sec.section_key,
@@ -63,21 +82,14 @@ async def get_progress_overview(db: AsyncSession = Depends(get_db)):
             completed=sec_completed,
             in_progress=sec_in_progress,
             not_started=max(0, sec_not_started),
-            average_confidence=round(float(sec_row.avg_confidence or 0), 1),
+            average_confidence=round(sec_avg, 1),
             completion_percentage=round(sec_completed / sec.item_count * 100, 1) if sec.item_count > 0 else 0,
         ))
 
-    # Days active (distinct dates with activity)
-    active_stmt = select(
-        func.count(func.date(Progress.updated_at).distinct())
-    )
-    active_result = await db.execute(active_stmt)
-    days_active = active_result.scalar() or 0
-
-    # Current streak (consecutive days)
-    streak = await _calculate_streak(db)
+    days_active = rows[0].days_active if rows else 0
+    streak = rows[0].streak if rows else 0
 
-    return OverallProgress(
+    body = OverallProgress(
         total_items=total_items,
         completed=completed,
         in_progress=in_progress,
@@ -87,25 +99,45 @@ async def get_progress_overview(db: AsyncSession = Depends(get_db)):
         sections=sections,
         days_active=days_active,
         current_streak=streak,
-    )
+    ).model_dump_json().encode()
+    progress_cache.put(cache_key, version, body)
+    return Response(content=body, media_type="application/json")
 
 
-@router.get("/items", response_model=list[ProgressResponse])
+@router.get("/items", response_model=ProgressPage)
 async def list_progress(
     section: str | None = Query(None),
     status: str | None = Query(None),
+    cursor: str | None = Query(None),
+    limit: int = Query(50, ge=1, le=200),
     db: AsyncSession = Depends(get_db),
 ):
-    """List progress records, optionally filtered by section and status."""
+    """List progress records, newest first, optionally filtered by section and status.
+
+    Keyset-paginated: pass the returned `next_cursor` to fetch the following page.
+    """
     stmt = select(Progress)
     if section:
         stmt = stmt.where(Progress.section == section)
     if status:
         stmt = stmt.where(Progress.status == status)
-    stmt = stmt.order_by(Progress.updated_at.desc())
+    if cursor:
+        try:
+            after = decode_cursor(cursor, int)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        stmt = stmt.where(tuple_(Progress.updated_at, Progress.id) < tuple_(*after))
+    stmt = stmt.order_by(Progress.updated_at.desc(), Progress.id.desc()).limit(limit)
 
     result = await db.execute(stmt)
-    return result.scalars().all()
+    items = result.scalars().all()
+    next_cursor = None
+    if len(items) == limit:
+        next_cursor = encode_cursor(items[-1].updated_at, items[-1].id)
+    # Validate the ORM rows and serialize with pydantic-core; returning a Response
+    # skips FastAPI's second validation and jsonable_encoder walk
+    page = ProgressPage.model_validate({"items": items, "next_cursor": next_cursor})
+    return Response(content=page.model_dump_json(), media_type="application/json")
 
 
 @router.get("/items/{item_id:path}", response_model=ProgressResponse)
@@ -122,122 +154,120 @@ async def get_progress(item_id: str, db: AsyncSession = Depends(get_db)):
 @router.post("/items", response_model=ProgressResponse)
 async def create_or_update_progress(data: ProgressCreate, db: AsyncSession = Depends(get_db)):
     """Create or update progress for an item."""
-    stmt = select(Progress).where(Progress.item_id == data.item_id)
+    stmt = (
+        _upsert_progress([data], datetime.utcnow())
+        .returning(Progress)
+        .execution_options(populate_existing=True)
+    )
     result = await db.execute(stmt)
-    progress = result.scalar_one_or_none()
-
-    now = datetime.utcnow()
-    if progress:
-        progress.status = data.status
-        progress.confidence = data.confidence
-        progress.times_reviewed = progress.times_reviewed + 1
-        progress.last_reviewed_at = now
-        if data.status == "completed":
-            progress.completed_at = now
-    else:
-        progress = Progress(
-            item_id=data.item_id,
-            section=data.section,
-            status=data.status,
-            confidence=data.confidence,
-            times_reviewed=1,
-            last_reviewed_at=now,
-            completed_at=now if data.status == "completed" else None,
-        )
-        db.add(progress)
-
-    await db.flush()
-    await db.refresh(progress)
-    return progress
+    progress_cache.invalidate(db)
+    return result.scalar_one()
 
 
 @router.patch("/items/{item_id:path}", response_model=ProgressResponse)
 async def update_progress(item_id: str, data: ProgressUpdate, db: AsyncSession = Depends(get_db)):
     """Partially update progress for an item."""
-    stmt = select(Progress).where(Progress.item_id == item_id)
-    result = await db.execute(stmt)
-    progress = result.scalar_one_or_none()
-    if not progress:
-        raise HTTPException(status_code=404, detail=f"No progress found for '{item_id}'")
-
     now = datetime.utcnow()
+    values = {
+        "times_reviewed": Progress.times_reviewed + 1,
+        "last_reviewed_at": now,
+    }
     if data.status is not None:
-        progress.status = data.status
+        values["status"] = data.status
         if data.status == "completed":
-            progress.completed_at = now
+            values["completed_at"] = now
     if data.confidence is not None:
-        progress.confidence = data.confidence
+        values["confidence"] = data.confidence
 
-    progress.times_reviewed = progress.times_reviewed + 1
-    progress.last_reviewed_at = now
+    # UPDATE ... RETURNING: a missing row yields nothing, so no prior SELECT
+    stmt = (
+        update(Progress)
+        .where(Progress.item_id == item_id)
+        .values(**values)
+        .returning(Progress)
+        .execution_options(populate_existing=True)
+    )
+    result = await db.execute(stmt)
+    progress = result.scalar_one_or_none()
+    if not progress:
+        raise HTTPException(status_code=404, detail=f"No progress found for '{item_id}'")
 
-    await db.flush()
-    await db.refresh(progress)
+    progress_cache.invalidate(db)
     return progress
 
 
 @router.post("/batch")
 async def batch_update_progress(items: list[ProgressCreate], db: AsyncSession = Depends(get_db)):
     """Batch create/update progress for multiple items."""
-    results = []
-    now = datetime.utcnow()
-
-    for data in items:
-        stmt = select(Progress).where(Progress.item_id == data.item_id)
-        result = await db.execute(stmt)
-        progress = result.scalar_one_or_none()
-
-        if progress:
-            progress.status = data.status
-            progress.confidence = data.confidence
-            progress.times_reviewed = progress.times_reviewed + 1
-            progress.last_reviewed_at = now
-            if data.status == "completed":
-                progress.completed_at = now
-        else:
-            progress = Progress(
-                item_id=data.item_id,
-                section=data.section,
-                status=data.status,
-                confidence=data.confidence,
-                times_reviewed=1,
-                last_reviewed_at=now,
-                completed_at=now if data.status == "completed" else None,
-            )
-            db.add(progress)
-
-        results.append(data.item_id)
-
-    return {"updated": len(results), "item_ids": results}
-
-
-async def _calculate_streak(db: AsyncSession) -> int:
-    """Calculate the current consecutive-day streak."""
-    date_col = func.date(Progress.updated_at).label("activity_date")
-    stmt = (
-        select(date_col)
-        .group_by(date_col)
-        .order_by(date_col.desc())
+    if not items:
+        return {"updated": 0, "item_ids": []}
+
+    await db.execute(_upsert_progress(items, datetime.utcnow()))
+    progress_cache.invalidate(db)
+
+    item_ids = [data.item_id for data in items]
+    return {"updated": len(item_ids), "item_ids": item_ids}
+
+
+def _upsert_progress(items: list[ProgressCreate], now: datetime):
+    """INSERT ... ON CONFLICT DO UPDATE recording a review of each item."""
+    stmt = upsert_insert(Progress).values([
+        {
+            "item_id": data.item_id,
+            "section": data.section,
+            "status": data.status,
+            "confidence": data.confidence,
+            "times_reviewed": 1,
+            "last_reviewed_at": now,
+            "completed_at": now if data.status == "completed" else None,
+        }
+        for data in items
+    ])
+    # ON CONFLICT DO UPDATE ignores Column.onupdate, so bump updated_at explicitly
+    return stmt.on_conflict_do_update(
+        index_elements=[Progress.item_id],
+        set_={
+            "status": stmt.excluded.status,
+            "confidence": stmt.excluded.confidence,
+            "times_reviewed": Progress.times_reviewed + 1,
+            "last_reviewed_at": now,
+            "completed_at": case(
+                (stmt.excluded.status == "completed", now), else_=Progress.completed_at
+            ),
+            "updated_at": func.now(),
+        },
     )
-    result = await db.execute(stmt)
-    dates = [r[0] for r in result.all()]
 
-    if not dates:
-        return 0
 
-    today = datetime.utcnow().date()
-    streak = 0
-    expected = today
-
-    for d in dates:
-        if d == expected:
-            streak += 1
-            expected = d - timedelta(days=1)
-        elif d == expected - timedelta(days=1):
-            # Allow gap of one day (yesterday might not have been tracked yet today)
-            expected = d - timedelta(days=1)
-            streak += 1
-        else:
-            break
-
-    return streak
+def _activity_columns(today: date):
+    """Scalar subqueries for the number of active days and the current streak.
+
+    The streak counts back from today (or yesterday, if today has no activity
+    yet) and tolerates single missed days: gaps-and-islands over the distinct
+    activity dates, where a jump of more than two days starts a new island.
+    """
+    activity = (
+        select(func.date(Progress.updated_at).label("day")).distinct().cte("activity")
+    )
+    newer_day = func.lag(activity.c.day).over(order_by=activity.c.day.desc())
+    gaps = select(
+        activity.c.day,
+        case((func.julianday(newer_day) - func.julianday(activity.c.day) > 2, 1), else_=0).label("brk"),
+    ).cte("activity_gaps")
+    islands = select(
+        gaps.c.day,
+        func.sum(gaps.c.brk).over(order_by=gaps.c.day.desc()).label("island"),
+    ).cte("activity_islands")
+
+    latest = select(func.max(activity.c.day)).scalar_subquery()
+    days_active = select(func.count()).select_from(activity).scalar_subquery()
+    streak = (
+        select(func.count())
+        .select_from(islands)
+        .where(
+            islands.c.island == 0,
+            latest.between((today - timedelta(days=1)).isoformat(), today.isoformat()),
+        )
+        .scalar_subquery()
+    )
+    return days_active, streak
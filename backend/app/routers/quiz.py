@@ -3,27 +3,38 @@ Quiz router — generate quizzes, submit answers, view history.
 """
 
 import uuid
-import json
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, insert, tuple_
 
-from app.database import get_db
-from app.models.quiz_attempt import QuizAttempt
+from app.database import get_db, upsert_insert
+from app.models.quiz_attempt import QuizAttempt, QuizSessionSummary
 from app.schemas.schemas import (
     QuizGenerateRequest,
     QuizQuestion,
     QuizSubmitRequest,
     QuizResult,
     QuizHistoryItem,
+    QuizHistoryPage,
     LLMConfig,
 )
-from app.services.quiz_generator import generate_static_quiz, generate_ai_quiz
+from app.services.quiz_generator import generate_static_quiz, generate_ai_quiz, stream_ai_quiz
+from app.utils.pagination import decode_cursor, encode_cursor
 
 router = APIRouter(prefix="/api/quiz", tags=["Quiz"])
 
 
+def _sse_event(payload: dict) -> bytes:
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
+_DONE_FRAME = _sse_event({"type": "done", "content": ""})
+
+
 @router.post("/generate", response_model=list[QuizQuestion])
 async def generate_quiz(request: QuizGenerateRequest):
     """Generate a quiz for a given section."""
@@ -61,40 +72,85 @@ async def generate_ai_quiz_endpoint(request: QuizGenerateRequest, llm_config: LL
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/generate-ai-stream")
+async def generate_ai_quiz_stream(request: QuizGenerateRequest, llm_config: LLMConfig):
+    """Generate AI-powered quiz questions, streaming each one via SSE as soon as it is complete."""
+    async def event_generator():
+        try:
+            async for question in stream_ai_quiz(
+                section=request.section,
+                count=request.count,
+                difficulty=request.difficulty,
+                topic=request.topic,
+                llm_config=llm_config,
+            ):
+                yield _sse_event({"type": "question", "content": question.model_dump()})
+        except ValueError as e:
+            # Headers are already sent, so the error travels as a frame instead of a 400
+            yield _sse_event({"type": "error", "content": str(e)})
+        yield _DONE_FRAME
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
 @router.post("/submit", response_model=QuizResult)
 async def submit_quiz(request: QuizSubmitRequest, db: AsyncSession = Depends(get_db)):
     """Submit quiz answers and get results."""
+    attempts = []
     results = []
-    correct_count = 0
+    # (section, topic) -> [questions, correct answers] for the history summaries
+    totals: dict[tuple[str, str], list[int]] = {}
 
     for answer in request.answers:
-        is_correct = answer.get("selected_answer") == answer.get("correct_answer")
-        if is_correct:
-            correct_count += 1
-
-        attempt = QuizAttempt(
-            session_id=request.session_id,
-            section=answer.get("section", ""),
-            topic=answer.get("topic"),
-            question=answer.get("question", ""),
-            options=json.dumps(answer.get("options")) if answer.get("options") else None,
-            selected_answer=answer.get("selected_answer"),
-            correct_answer=answer.get("correct_answer", ""),
-            is_correct=is_correct,
-            explanation=answer.get("explanation"),
-            question_type=answer.get("question_type", "mcq"),
-            time_taken_seconds=answer.get("time_taken_seconds"),
-        )
-        db.add(attempt)
+        # Read each field once; the same values feed the row, the result and the totals
+        question = answer.get("question", "")
+        section = answer.get("section", "")
+        topic = answer.get("topic")
+        selected = answer.get("selected_answer")
+        correct = answer.get("correct_answer", "")
+        explanation = answer.get("explanation")
+        options = answer.get("options")
+        is_correct = selected == correct
+
+        attempts.append({
+            "session_id": request.session_id,
+            "section": section,
+            "topic": topic,
+            "question": question,
+            "options": options or None,
+            "selected_answer": selected,
+            "correct_answer": correct,
+            "is_correct": is_correct,
+            "explanation": explanation,
+            "question_type": answer.get("question_type", "mcq"),
+            "time_taken_seconds": answer.get("time_taken_seconds"),
+        })
         results.append({
-            "question": answer.get("question", ""),
-            "selected_answer": answer.get("selected_answer"),
-            "correct_answer": answer.get("correct_answer"),
+            "question": question,
+            "selected_answer": selected,
+            "correct_answer": correct,
             "is_correct": is_correct,
-            "explanation": answer.get("explanation"),
+            "explanation": explanation,
         })
+        counts = totals.setdefault((section, topic or ""), [0, 0])
+        counts[0] += 1
+        counts[1] += is_correct
 
-    total = len(request.answers)
+    # One executemany INSERT for the whole quiz, bypassing the ORM unit of work
+    if attempts:
+        await db.execute(insert(QuizAttempt), attempts)
+        await _upsert_summaries(db, request.session_id, totals)
+
+    total = len(results)
+    correct_count = sum(r["is_correct"] for r in results)
     score_pct = (correct_count / total * 100) if total > 0 else 0
 
     return QuizResult(
@@ -106,34 +162,76 @@ async def submit_quiz(request: QuizSubmitRequest, db: AsyncSession = Depends(get
     )
 
 
-@router.get("/history", response_model=list[QuizHistoryItem])
-async def get_quiz_history(db: AsyncSession = Depends(get_db)):
-    """Get quiz session history."""
-    stmt = (
-        select(
-            QuizAttempt.session_id,
-            QuizAttempt.section,
-            QuizAttempt.topic,
-            func.count(QuizAttempt.id).label("total"),
-            func.sum(QuizAttempt.is_correct.cast(int)).label("correct"),
-            func.min(QuizAttempt.created_at).label("created_at"),
-        )
-        .group_by(QuizAttempt.session_id, QuizAttempt.section, QuizAttempt.topic)
-        .order_by(func.min(QuizAttempt.created_at).desc())
-        .limit(50)
+async def _upsert_summaries(db: AsyncSession, session_id: str, totals: dict[tuple[str, str], list[int]]):
+    """Add this submission's per-(section, topic) totals to the history summaries."""
+    stmt = upsert_insert(QuizSessionSummary).values([
+        {
+            "session_id": session_id,
+            "section": section,
+            "topic": topic,
+            "total_questions": total,
+            "correct_answers": correct,
+        }
+        for (section, topic), (total, correct) in totals.items()
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[
+            QuizSessionSummary.session_id,
+            QuizSessionSummary.section,
+            QuizSessionSummary.topic,
+        ],
+        set_={
+            "total_questions": QuizSessionSummary.total_questions + stmt.excluded.total_questions,
+            "correct_answers": QuizSessionSummary.correct_answers + stmt.excluded.correct_answers,
+        },
     )
+    await db.execute(stmt)
+
+
+@router.get("/history", response_model=QuizHistoryPage)
+async def get_quiz_history(
+    cursor: str | None = Query(None),
+    limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get quiz session history, newest first.
+
+    Keyset-paginated: pass the returned `next_cursor` to fetch the following page.
+    """
+    stmt = select(QuizSessionSummary)
+    if cursor:
+        try:
+            after = decode_cursor(cursor, str, int)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        stmt = stmt.where(
+            tuple_(QuizSessionSummary.created_at, QuizSessionSummary.session_id, QuizSessionSummary.id)
+            < tuple_(*after)
+        )
+    # A session has one row per (section, topic), so id breaks ties within it
+    stmt = stmt.order_by(
+        QuizSessionSummary.created_at.desc(),
+        QuizSessionSummary.session_id.desc(),
+        QuizSessionSummary.id.desc(),
+    ).limit(limit)
     result = await db.execute(stmt)
-    rows = result.all()
+    rows = result.scalars().all()
 
-    return [
+    items = [
         QuizHistoryItem(
             session_id=r.session_id,
             section=r.section,
-            topic=r.topic,
-            total_questions=r.total,
-            correct_answers=r.correct or 0,
-            score_percentage=round((r.correct or 0) / r.total * 100, 1) if r.total > 0 else 0,
+            topic=r.topic or None,
+            total_questions=r.total_questions,
+            correct_answers=r.correct_answers,
+            score_percentage=round(r.correct_answers / r.total_questions * 100, 1) if r.total_questions > 0 else 0,
             created_at=r.created_at,
         )
         for r in rows
     ]
+    next_cursor = None
+    if len(rows) == limit:
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].session_id, rows[-1].id)
+    # Serialize directly; returning a Response skips FastAPI's re-validation
+    page = QuizHistoryPage.model_construct(items=items, next_cursor=next_cursor)
+    return Response(content=page.model_dump_json(), media_type="application/json")
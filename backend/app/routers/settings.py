@@ -9,13 +9,37 @@ from sqlalchemy import select
 from app.database import get_db
 from app.models.user import User
 from app.schemas.schemas import UserSettingsUpdate, UserSettingsResponse
-from app.utils.encryption import encrypt_value, decrypt_value
+from app.utils.encryption import encrypt_value, decrypt_value, clear_decrypt_cache
 
 router = APIRouter(prefix="/api/settings", tags=["Settings"])
 
+# Providers whose keys are stored encrypted as `<provider>_api_key` on User
+KEY_PROVIDERS = ("gemini", "openai", "anthropic")
+
+
+def _mask_key(key: str) -> str:
+    """Show the first 8 and last 4 chars of a key."""
+    return key[:8] + "..." + key[-4:] if len(key) > 12 else "***"
+
+
+def _set_api_key(user: User, provider: str, key: str | None):
+    """Store a provider key encrypted, with its masked preview; None or "" clears it."""
+    setattr(user, f"{provider}_api_key", encrypt_value(key) if key else None)
+    setattr(user, f"{provider}_api_key_preview", _mask_key(key) if key else None)
+
+
+# Primary key of the singleton "default" user, remembered after the first lookup
+_default_user_id: int | None = None
+
 
 async def _get_or_create_user(db: AsyncSession) -> User:
     """Get the default user or create one."""
+    global _default_user_id
+    if _default_user_id is not None:
+        user = await db.get(User, _default_user_id)
+        if user is not None:
+            return user
+
     stmt = select(User).where(User.username == "default")
     result = await db.execute(stmt)
     user = result.scalar_one_or_none()
@@ -23,7 +47,7 @@ async def _get_or_create_user(db: AsyncSession) -> User:
         user = User(username="default")
         db.add(user)
         await db.flush()
-        await db.refresh(user)
+    _default_user_id = user.id
     return user
 
 
@@ -50,17 +74,15 @@ async def update_settings(data: UserSettingsUpdate, db: AsyncSession = Depends(g
         user.preferred_provider = data.preferred_provider
     if data.preferred_model is not None:
         user.preferred_model = data.preferred_model
-    if data.gemini_api_key is not None:
-        user.gemini_api_key = encrypt_value(data.gemini_api_key) if data.gemini_api_key else None
-    if data.openai_api_key is not None:
-        user.openai_api_key = encrypt_value(data.openai_api_key) if data.openai_api_key else None
-    if data.anthropic_api_key is not None:
-        user.anthropic_api_key = encrypt_value(data.anthropic_api_key) if data.anthropic_api_key else None
+    for provider in KEY_PROVIDERS:
+        key = getattr(data, f"{provider}_api_key")
+        if key is not None:
+            _set_api_key(user, provider, key)
     if data.ollama_base_url is not None:
         user.ollama_base_url = data.ollama_base_url
 
     await db.flush()
-    await db.refresh(user)
+    clear_decrypt_cache()
 
     return {
         "status": "updated",
@@ -71,29 +93,26 @@ async def update_settings(data: UserSettingsUpdate, db: AsyncSession = Depends(g
 
 @router.get("/api-key/{provider}")
 async def get_stored_api_key(provider: str, db: AsyncSession = Depends(get_db)):
-    """Retrieve stored (encrypted) API key for a provider. Returns decrypted key."""
+    """Return a masked preview of the stored API key for a provider."""
     user = await _get_or_create_user(db)
 
-    key_map = {
-        "gemini": user.gemini_api_key,
-        "openai": user.openai_api_key,
-        "anthropic": user.anthropic_api_key,
-    }
-
     if provider == "ollama":
         return {"provider": "ollama", "base_url": user.ollama_base_url}
 
-    encrypted_key = key_map.get(provider)
+    encrypted_key = getattr(user, f"{provider}_api_key") if provider in KEY_PROVIDERS else None
     if not encrypted_key:
         raise HTTPException(status_code=404, detail=f"No API key stored for {provider}")
 
-    try:
-        decrypted = decrypt_value(encrypted_key)
-        # Return masked key (show first 8 and last 4 chars)
-        masked = decrypted[:8] + "..." + decrypted[-4:] if len(decrypted) > 12 else "***"
-        return {"provider": provider, "key_preview": masked, "has_key": True}
-    except Exception:
-        return {"provider": provider, "has_key": True, "key_preview": "***"}
+    preview = getattr(user, f"{provider}_api_key_preview")
+    if preview is None:
+        # Keys saved before previews existed: decrypt once and persist the preview
+        try:
+            preview = _mask_key(decrypt_value(encrypted_key))
+        except Exception:
+            return {"provider": provider, "has_key": True, "key_preview": "***"}
+        setattr(user, f"{provider}_api_key_preview", preview)
+
+    return {"provider": provider, "key_preview": preview, "has_key": True}
 
 
 @router.delete("/api-key/{provider}")
@@ -101,15 +120,12 @@ async def delete_api_key(provider: str, db: AsyncSession = Depends(get_db)):
     """Delete stored API key for a provider."""
     user = await _get_or_create_user(db)
 
-    if provider == "gemini":
-        user.gemini_api_key = None
-    elif provider == "openai":
-        user.openai_api_key = None
-    elif provider == "anthropic":
-        user.anthropic_api_key = None
+    if provider in KEY_PROVIDERS:
+        _set_api_key(user, provider, None)
     elif provider == "ollama":
         user.ollama_base_url = "http://localhost:11434"
     else:
         raise HTTPException(status_code=400, detail=f"Unknown provider: {provider}")
+    clear_decrypt_cache()
 
     return {"status": "deleted", "provider": provider}
@@ -10,28 +10,43 @@ class ResearchPaper(BaseModel):
     topic: str
     relevance: str
 
+    class Config:
+        frozen = True
+
 
 class KeyTopic(BaseModel):
     concept: str
     detail: str
 
+    class Config:
+        frozen = True
+
 
 class DSADesignMapping(BaseModel):
     id: int
     dsa_problem: str
     system_design: str
 
+    class Config:
+        frozen = True
+
 
 class DesignScenario(BaseModel):
     scenario: str
     probes: list[str]
     follow_up: str | None = None
 
+    class Config:
+        frozen = True
+
 
 class DSAFollowUp(BaseModel):
     problem: str
     follow_up: str
 
+    class Config:
+        frozen = True
+
 
 class ContentSection(BaseModel):
     section_key: str
@@ -39,6 +54,9 @@ class ContentSection(BaseModel):
     description: str
     item_count: int
 
+    class Config:
+        frozen = True
+
 
 class ContentItem(BaseModel):
     item_id: str
@@ -50,16 +68,25 @@ class ContentItem(BaseModel):
     short_answer: str | None = None
     detailed_answer: str | None = None
 
+    class Config:
+        frozen = True
+
 
 class InterviewSubcategory(BaseModel):
     name: str
     items: list[ContentItem]
 
+    class Config:
+        frozen = True
+
 
 class InterviewCategory(BaseModel):
     category: str
     subcategories: list[InterviewSubcategory]
 
+    class Config:
+        frozen = True
+
 
 class FlashCard(BaseModel):
     item_id: str
@@ -68,6 +95,9 @@ class FlashCard(BaseModel):
     back: str
     category: str
 
+    class Config:
+        frozen = True
+
 
 # ─── Progress Schemas ──────────────────────────────────────────
 
@@ -99,6 +129,11 @@ class ProgressResponse(BaseModel):
         from_attributes = True
 
 
+class ProgressPage(BaseModel):
+    items: list[ProgressResponse]
+    next_cursor: str | None = None
+
+
 class SectionProgress(BaseModel):
     section: str
     total: int
@@ -192,6 +227,11 @@ class QuizHistoryItem(BaseModel):
     created_at: datetime
 
 
+class QuizHistoryPage(BaseModel):
+    items: list[QuizHistoryItem]
+    next_cursor: str | None = None
+
+
 # ─── Study Plan Schemas ────────────────────────────────────────
 
 class StudyDay(BaseModel):
@@ -199,8 +239,8 @@ class StudyDay(BaseModel):
     week: int
     title: str
     description: str
-    tasks: list[str]
-    linked_sections: list[str]
+    tasks: tuple[str, ...]
+    linked_sections: tuple[str, ...]
     is_completed: bool = False
 
 
@@ -3,138 +3,388 @@ Content loader service — parses genai.json at startup and indexes every item
 with a composite section:id key for cross-feature reference.
 """
 
-import json
+import hashlib
+import os
+import pickle
+import sys
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
+
+import orjson
+
 from app.config import settings
-from app.schemas.schemas import (
-    ContentSection,
-    ContentItem,
-    FlashCard,
-    InterviewCategory,
-    InterviewSubcategory,
-)
+from app.schemas.schemas import ContentItem, InterviewCategory, InterviewSubcategory
+
+
+# ─── Internal Records ──────────────────────────────────────────
+# Plain slotted mirrors of the ContentSection/ContentItem/FlashCard schemas.
+# Indexed content is trusted and read-only, so it skips pydantic entirely;
+# orjson serializes these dataclasses natively with the same field order.
+
+@dataclass(slots=True)
+class _ContentSection:
+    section_key: str
+    title: str
+    description: str
+    item_count: int
+
+
+@dataclass(slots=True)
+class _ContentItem:
+    item_id: str
+    section: str
+    title: str
+    subtitle: str | None = None
+    detail: str | None = None
+    extra: dict | None = None
+    short_answer: str | None = None
+    detailed_answer: str | None = None
+
+
+@dataclass(slots=True)
+class _FlashCard:
+    item_id: str
+    section: str
+    front: str
+    back: str
+    category: str
+
+
+def _norm(entry, key: str) -> tuple[str, str | None, str | None]:
+    """Title, short and detailed answer of an entry that is either a dict or a bare string."""
+    if type(entry) is dict:
+        return entry.get(key, str(entry)), entry.get("short_answer"), entry.get("detailed_answer")
+    return str(entry), None, None
+
+
+# Bump when the indexed state changes shape, so old cache files are rebuilt
+_CACHE_FORMAT = 9
 
 
 class ContentLoader:
+    # Indexed state persisted by the on-disk cache
+    _CACHED_ATTRS = (
+        "_sections", "_items", "_prompt_items", "_flashcards", "_items_by_id", "_items_by_subkey",
+        "_search_blobs", "_all_items_json", "_sections_json", "_stats_json",
+        "_interview_questions", "_interview_questions_json", "_item_json", "_items_json",
+        "_flashcards_json", "_all_flashcards_json", "_study_plan",
+    )
+
     def __init__(self):
+        # Bumped on every load() so derived caches can key on it
+        self._version = 0
         self._data: dict = {}
-        self._sections: list[ContentSection] = []
-        self._items: dict[str, list[ContentItem]] = {}
-        self._flashcards: dict[str, list[FlashCard]] = {}
-        self._all_items: list[ContentItem] = []
-        self._all_flashcards: list[FlashCard] = []
+        self._sections: list[_ContentSection] = []
+        # Per-section lists while indexing, frozen to tuples once it finishes
+        self._items: dict[str, Sequence[_ContentItem]] = {}
+        # Per-section items in title order, the order prompts list them in
+        self._prompt_items: dict[str, tuple[_ContentItem, ...]] = {}
+        self._flashcards: dict[str, Sequence[_FlashCard]] = {}
+        self._items_by_id: dict[str, _ContentItem] = {}
+        self._items_by_subkey: dict[tuple[str, str | None], Sequence[_ContentItem]] = {}
+        self._pretty_names: dict[str, str] = {}
+        # Columnar views parallel to all_items, built once after indexing
+        self._search_blobs: list[str] = []
+        self._all_items_json: list[bytes] = []
+        self._sections_json: bytes = b"[]"
+        self._stats_json: bytes = b"{}"
+        self._interview_questions: tuple[InterviewCategory, ...] = ()
+        self._interview_questions_json: bytes = b"[]"
+        self._item_json: dict[str, bytes] = {}
+        self._items_json: dict[str, bytes] = {}
+        self._flashcards_json: dict[str, bytes] = {}
+        self._all_flashcards_json: bytes = b"[]"
         self._study_plan: dict = {}
-        self._raw: dict = {}
 
     def load(self, path: str | None = None):
-        json_path = path or settings.GENAI_JSON_PATH
-        with open(json_path, "r", encoding="utf-8") as f:
-            self._data = json.load(f)
-        self._raw = self._data
-        self._index_all()
+        json_path = Path(path or settings.GENAI_JSON_PATH)
+        stat = json_path.stat()
+        cache_prefix = self._cache_prefix(json_path)
+        cache_path = Path(settings.CONTENT_CACHE_DIR) / f"{cache_prefix}.{stat.st_mtime_ns}.{stat.st_size}.pkl"
+        if not self._load_cache(cache_path):
+            # orjson parses the raw bytes directly, skipping the text decode layer
+            self._data = orjson.loads(json_path.read_bytes())
+            self._index_all()
+            # Everything needed afterwards now lives in the indexes
+            self._data = {}
+            self._write_cache(cache_path)
+        self._remove_stale_caches(cache_prefix, cache_path)
+        self._version += 1
+
+    # ─── On-disk Cache ─────────────────────────────────────────
+    # The indexed state is pickled into CONTENT_CACHE_DIR, keyed by the content
+    # file's path, mtime and size, so restarts skip parsing and indexing until
+    # the file changes. Unpickling runs code, so the cache lives in a directory
+    # the app owns rather than next to genai.json, and files another user could
+    # have written are ignored.
+
+    @staticmethod
+    def _cache_prefix(json_path: Path) -> str:
+        path_hash = hashlib.sha256(str(json_path.resolve()).encode()).hexdigest()[:16]
+        return f"{json_path.name}.{path_hash}"
+
+    @staticmethod
+    def _is_trusted(f) -> bool:
+        if not hasattr(os, "getuid"):
+            return True
+        st = os.fstat(f.fileno())
+        return st.st_uid == os.getuid() and not st.st_mode & 0o022
+
+    def _load_cache(self, cache_path: Path) -> bool:
+        try:
+            with cache_path.open("rb") as f:
+                if not self._is_trusted(f):
+                    return False
+                fmt, state = pickle.load(f)
+        except FileNotFoundError:
+            return False
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, ValueError, OSError):
+            # Corrupt or written by an incompatible version — rebuild it
+            return False
+        if fmt != _CACHE_FORMAT:
+            return False
+        for attr in self._CACHED_ATTRS:
+            setattr(self, attr, state[attr])
+        return True
+
+    def _write_cache(self, cache_path: Path):
+        state = {attr: getattr(self, attr) for attr in self._CACHED_ATTRS}
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            with tmp_path.open("wb") as f:
+                pickle.dump((_CACHE_FORMAT, state), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # Unwritable cache directory: run without the cache
+            tmp_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _remove_stale_caches(cache_prefix: str, cache_path: Path):
+        for stale in cache_path.parent.glob(f"{cache_prefix}.*.pkl"):
+            if stale != cache_path:
+                try:
+                    stale.unlink()
+                except OSError:
+                    pass
 
     @property
-    def raw(self) -> dict:
-        return self._raw
+    def version(self) -> int:
+        return self._version
 
     @property
-    def sections(self) -> list[ContentSection]:
+    def sections(self) -> list[_ContentSection]:
         return self._sections
 
     @property
-    def all_items(self) -> list[ContentItem]:
-        return self._all_items
+    def sections_json(self) -> bytes:
+        return self._sections_json
+
+    @property
+    def stats_json(self) -> bytes:
+        return self._stats_json
+
+    @property
+    def interview_questions_json(self) -> bytes:
+        return self._interview_questions_json
 
     @property
-    def all_flashcards(self) -> list[FlashCard]:
-        return self._all_flashcards
+    def all_items(self) -> Iterator[_ContentItem]:
+        """Every item in section order, chained over the per-section lists."""
+        return chain.from_iterable(self._items.values())
 
-    def get_items(self, section: str) -> list[ContentItem]:
-        return self._items.get(section, [])
+    @property
+    def all_flashcards(self) -> Iterator[_FlashCard]:
+        return chain.from_iterable(self._flashcards.values())
+
+    @property
+    def total_items(self) -> int:
+        return sum(map(len, self._items.values()))
+
+    @property
+    def total_flashcards(self) -> int:
+        return sum(map(len, self._flashcards.values()))
 
-    def get_flashcards(self, section: str | None = None) -> list[FlashCard]:
+    def get_items(self, section: str) -> Sequence[_ContentItem]:
+        return self._items.get(section, ())
+
+    def get_prompt_items(self, section: str) -> Sequence[_ContentItem]:
+        """Items of a section sorted by title, for building LLM prompts.
+
+        The first N items must be byte-stable across restarts and reorderings of
+        genai.json for OpenAI/Anthropic/Gemini prefix caching to hit, so prompts
+        take their slices from this order rather than file order.
+        """
+        return self._prompt_items.get(section, ())
+
+    def get_flashcards(self, section: str | None = None) -> Sequence[_FlashCard]:
         if section:
-            return self._flashcards.get(section, [])
-        return self._all_flashcards
+            return self._flashcards.get(section, ())
+        return list(self.all_flashcards)
+
+    def get_items_json(self, section: str) -> bytes | None:
+        """Pre-serialized items of a section, or None if it has none."""
+        return self._items_json.get(section)
 
-    def get_item(self, item_id: str) -> ContentItem | None:
-        for item in self._all_items:
-            if item.item_id == item_id:
-                return item
-        return None
+    def get_flashcards_json(self, section: str | None = None) -> bytes | None:
+        """Pre-serialized flashcards of a section (all if None), or None if it has none."""
+        if section:
+            return self._flashcards_json.get(section)
+        return self._all_flashcards_json
+
+    def get_item_json(self, item_id: str) -> bytes | None:
+        return self._item_json.get(item_id)
+
+    def get_item(self, item_id: str) -> _ContentItem | None:
+        return self._items_by_id.get(item_id)
+
+    def search_json(self, query: str, limit: int = 50) -> bytes:
+        """Case-insensitive substring search over item title, subtitle and detail.
+
+        Returns the matching items as a pre-serialized JSON array.
+        """
+        query = query.lower()
+        hits = []
+        for i, blob in enumerate(self._search_blobs):
+            if query in blob:
+                hits.append(self._all_items_json[i])
+                if len(hits) >= limit:
+                    break
+        return b"[" + b",".join(hits) + b"]"
+
+    def get_stats(self) -> dict:
+        return {
+            "total_sections": len(self._sections),
+            "total_items": self.total_items,
+            "total_flashcards": self.total_flashcards,
+            "sections": [
+                {
+                    "key": s.section_key,
+                    "title": s.title,
+                    "item_count": s.item_count,
+                }
+                for s in self._sections
+            ],
+        }
 
     def get_study_plan(self) -> dict:
         return self._study_plan
 
     def get_section_item_count(self, section: str) -> int:
-        return len(self._items.get(section, []))
+        return len(self._items.get(section, ()))
 
     def _index_all(self):
         """Index all sections from genai.json into structured items & flashcards."""
         self._sections = []
         self._items = {}
         self._flashcards = {}
-        self._all_items = []
-        self._all_flashcards = []
-
-        # 1. Research Papers
-        self._index_research_papers()
-        # 2. Core Concepts - Modern LLM Engineering
-        self._index_modern_llm_engineering()
-        # 3. Core Concepts - Key 2026 Topics
-        self._index_key_2026_topics()
-        # 4. System Design - DSA to Design Mapping
-        self._index_dsa_design_mapping()
-        # 5. System Design - HLD Scenarios
-        self._index_hld_scenarios()
-        # 6. System Design - Amazon Evaluation Criteria
-        self._index_amazon_criteria()
-        # 7. System Design - Hard DSA Follow-ups
-        self._index_hard_dsa_followups()
-        # 8. Interview Viva - Resume Screening ML Quiz
-        self._index_resume_screening()
-        # 9. Interview Viva - General Topic Questions
-        self._index_general_topic_questions()
-        # 10. Python Senior Competencies
-        self._index_python_competencies()
-        # 11. AI Engineering Maturity Levels
-        self._index_ai_maturity_levels()
-        # 12. Study Plan
-        self._index_study_plan()
+        self._items_by_id = {}
+        self._items_by_subkey = {}
+
+        for indexer in self._INDEXERS:
+            indexer(self)
+        # Shared with every caller of get_items(), so make them read-only
+        self._items = {k: tuple(v) for k, v in self._items.items()}
+        self._flashcards = {k: tuple(v) for k, v in self._flashcards.items()}
+        self._items_by_subkey = {k: tuple(v) for k, v in self._items_by_subkey.items()}
+        self._prompt_items = {
+            k: tuple(sorted(v, key=lambda i: i.title)) for k, v in self._items.items()
+        }
+
+        self._build_interview_questions()
+        self._build_search_index()
+        self._build_json_cache()
 
     def _add_section(self, key: str, title: str, description: str, count: int):
         self._sections.append(
-            ContentSection(
+            _ContentSection(
                 section_key=key,
                 title=title,
                 description=description,
                 item_count=count,
             )
         )
+        # Seed the buckets so _add_item and _add_flashcard append without setdefault
+        self._items[key] = []
+        self._flashcards[key] = []
+
+    def _pretty(self, key: str) -> str:
+        """Display name for a snake_case key, computed and interned once per key."""
+        name = self._pretty_names.get(key)
+        if name is None:
+            name = self._pretty_names[key] = sys.intern(key.replace("_", " ").title())
+        return name
+
+    def _add_item(self, section: str, item: _ContentItem, sub_key: str | None = None):
+        # Section, subtitle and category values repeat across records; interning
+        # keeps a single string object per distinct value
+        item.section = sys.intern(item.section)
+        if item.subtitle is not None:
+            item.subtitle = sys.intern(item.subtitle)
+        self._items[section].append(item)
+        # sub_key is the middle segment of section:sub_key:i ids
+        if sub_key is not None:
+            self._items_by_subkey.setdefault((section, sub_key), []).append(item)
+        # First item wins on a duplicate id, matching the former linear scan
+        self._items_by_id.setdefault(item.item_id, item)
+
+    def _add_flashcard(self, section: str, card: _FlashCard):
+        card.section = sys.intern(card.section)
+        card.category = sys.intern(card.category)
+        self._flashcards[section].append(card)
+
+    def _build_search_index(self):
+        """Lowercase the searchable fields of every item once, so queries don't have to."""
+        # NUL keeps a query from matching across field boundaries
+        self._search_blobs = [
+            "\0".join(filter(None, (item.title, item.subtitle, item.detail))).lower()
+            for item in self.all_items
+        ]
+
+    def _build_json_cache(self):
+        """Pre-serialize the read-only payloads that are served as-is on every request."""
+        self._sections_json = orjson.dumps(self._sections)
+        self._stats_json = orjson.dumps(self.get_stats())
+        self._interview_questions_json = orjson.dumps(
+            [c.model_dump() for c in self._interview_questions]
+        )
 
-    def _add_item(self, section: str, item: ContentItem):
-        self._items.setdefault(section, []).append(item)
-        self._all_items.append(item)
-
-    def _add_flashcard(self, section: str, card: FlashCard):
-        self._flashcards.setdefault(section, []).append(card)
-        self._all_flashcards.append(card)
+        self._all_items_json = [orjson.dumps(item) for item in self.all_items]
+        self._item_json = {}
+        for item, body in zip(self.all_items, self._all_items_json):
+            self._item_json.setdefault(item.item_id, body)
+        body_of = {id(item): body for item, body in zip(self.all_items, self._all_items_json)}
+        # Empty sections stay absent so their endpoints keep answering 404
+        self._items_json = {
+            section: b"[" + b",".join(body_of[id(i)] for i in items) + b"]"
+            for section, items in self._items.items()
+            if items
+        }
+        self._flashcards_json = {
+            section: orjson.dumps(cards) for section, cards in self._flashcards.items() if cards
+        }
+        self._all_flashcards_json = orjson.dumps(list(self.all_flashcards))
 
     # ─── Section Indexers ──────────────────────────────────────
+    # Items and flashcards are built from our own parsed JSON, so they are
+    # plain records created without validation.
 
     def _index_research_papers(self):
         papers = self._data.get("research_papers_must_read", [])
         section = "research_papers"
+        prefix = section + ":"
         self._add_section(section, "Research Papers", "Must-read foundational AI/ML papers", len(papers))
         for p in papers:
-            item_id = f"{section}:{p['id']}"
-            self._add_item(section, ContentItem(
+            item_id = prefix + str(p["id"])
+            self._add_item(section, _ContentItem(
                 item_id=item_id, section=section,
                 title=p["title"], subtitle=p["topic"], detail=p["relevance"],
                 short_answer=p.get("short_answer"),
                 detailed_answer=p.get("detailed_answer")
             ))
-            self._add_flashcard(section, FlashCard(
+            self._add_flashcard(section, _FlashCard(
                 item_id=item_id, section=section, category="Research Papers",
                 front=p["title"],
                 back=f"Topic: {p['topic']}\nRelevance: {p['relevance']}"
@@ -143,23 +393,17 @@ class ContentLoader:
     def _index_modern_llm_engineering(self):
         concepts = self._data.get("core_concepts", {}).get("modern_llm_engineering", [])
         section = "modern_llm_engineering"
+        prefix = section + ":"
         self._add_section(section, "Modern LLM Engineering", "Core concepts for LLM engineering", len(concepts))
         for i, c in enumerate(concepts):
-            item_id = f"{section}:{i}"
-            if isinstance(c, dict):
-                title = c.get("topic", str(c))
-                short_ans = c.get("short_answer")
-                detailed_ans = c.get("detailed_answer")
-            else:
-                title = str(c)
-                short_ans = None
-                detailed_ans = None
-            self._add_item(section, ContentItem(
+            item_id = prefix + str(i)
+            title, short_ans, detailed_ans = _norm(c, "topic")
+            self._add_item(section, _ContentItem(
                 item_id=item_id, section=section, title=title,
                 short_answer=short_ans, detailed_answer=detailed_ans
             ))
             front = title.split("(")[0].strip() if "(" in title else title
-            self._add_flashcard(section, FlashCard(
+            self._add_flashcard(section, _FlashCard(
                 item_id=item_id, section=section, category="LLM Engineering",
                 front=front,
                 back=short_ans or title
@@ -168,16 +412,17 @@ class ContentLoader:
     def _index_key_2026_topics(self):
         topics = self._data.get("core_concepts", {}).get("key_2026_topics", [])
         section = "key_2026_topics"
+        prefix = section + ":"
         self._add_section(section, "Key 2026 Topics", "Critical concepts for 2026 interviews", len(topics))
         for i, t in enumerate(topics):
-            item_id = f"{section}:{i}"
-            self._add_item(section, ContentItem(
+            item_id = prefix + str(i)
+            self._add_item(section, _ContentItem(
                 item_id=item_id, section=section,
                 title=t["concept"], detail=t["detail"],
                 short_answer=t.get("short_answer"),
                 detailed_answer=t.get("detailed_answer")
             ))
-            self._add_flashcard(section, FlashCard(
+            self._add_flashcard(section, _FlashCard(
                 item_id=item_id, section=section, category="Key Topics",
                 front=t["concept"], back=t.get("short_answer") or t["detail"]
             ))
@@ -185,14 +430,15 @@ class ContentLoader:
     def _index_dsa_design_mapping(self):
         mappings = self._data.get("system_design_mastery", {}).get("dsa_to_design_mapping", [])
         section = "dsa_design_mapping"
+        prefix = section + ":"
         self._add_section(section, "DSA → System Design", "DSA problems mapped to real system design patterns", len(mappings))
         for m in mappings:
-            item_id = f"{section}:{m['id']}"
-            self._add_item(section, ContentItem(
+            item_id = prefix + str(m["id"])
+            self._add_item(section, _ContentItem(
                 item_id=item_id, section=section,
                 title=m["dsa_problem"], detail=m["system_design"]
             ))
-            self._add_flashcard(section, FlashCard(
+            self._add_flashcard(section, _FlashCard(
                 item_id=item_id, section=section, category="DSA → Design",
                 front=f"DSA: {m['dsa_problem']}",
                 back=f"System Design: {m['system_design']}"
@@ -201,34 +447,37 @@ class ContentLoader:
     def _index_hld_scenarios(self):
         scenarios = self._data.get("system_design_mastery", {}).get("high_level_design_scenarios", [])
         section = "hld_scenarios"
+        prefix = section + ":"
         self._add_section(section, "HLD Scenarios", "High-level design interview scenarios with probes", len(scenarios))
         for i, s in enumerate(scenarios):
-            item_id = f"{section}:{i}"
-            extra = {"probes": s["probes"]}
-            if s.get("follow_up"):
-                extra["follow_up"] = s["follow_up"]
-            self._add_item(section, ContentItem(
+            item_id = prefix + str(i)
+            probes = s["probes"]
+            joined = ", ".join(probes)
+            follow_up = s.get("follow_up")
+            extra = {"probes": probes, "follow_up": follow_up} if follow_up else {"probes": probes}
+            self._add_item(section, _ContentItem(
                 item_id=item_id, section=section,
                 title=s["scenario"],
-                detail=", ".join(s["probes"]),
+                detail=joined,
                 extra=extra
             ))
-            self._add_flashcard(section, FlashCard(
+            self._add_flashcard(section, _FlashCard(
                 item_id=item_id, section=section, category="System Design",
                 front=s["scenario"],
-                back="Key probes: " + ", ".join(s["probes"])
+                back="Key probes: " + joined
             ))
 
     def _index_amazon_criteria(self):
         criteria = self._data.get("system_design_mastery", {}).get("amazon_evaluation_criteria", [])
         section = "amazon_criteria"
+        prefix = section + ":"
         self._add_section(section, "Amazon Eval Criteria", "How Amazon evaluates system design interviews", len(criteria))
         for i, c in enumerate(criteria):
-            item_id = f"{section}:{i}"
-            self._add_item(section, ContentItem(
+            item_id = prefix + str(i)
+            self._add_item(section, _ContentItem(
                 item_id=item_id, section=section, title=c
             ))
-            self._add_flashcard(section, FlashCard(
+            self._add_flashcard(section, _FlashCard(
                 item_id=item_id, section=section, category="Evaluation",
                 front=c.split("(")[0].strip() if "(" in c else c,
                 back=c
@@ -237,16 +486,17 @@ class ContentLoader:
     def _index_hard_dsa_followups(self):
         followups = self._data.get("system_design_mastery", {}).get("hard_dsa_follow_ups", [])
         section = "hard_dsa_followups"
+        prefix = section + ":"
         self._add_section(section, "Hard DSA Follow-ups", "Advanced follow-up questions for DSA problems", len(followups))
         for i, f in enumerate(followups):
-            item_id = f"{section}:{i}"
-            self._add_item(section, ContentItem(
+            item_id = prefix + str(i)
+            self._add_item(section, _ContentItem(
                 item_id=item_id, section=section,
                 title=f["problem"], detail=f["follow_up"],
                 short_answer=f.get("short_answer"),
                 detailed_answer=f.get("detailed_answer")
             ))
-            self._add_flashcard(section, FlashCard(
+            self._add_flashcard(section, _FlashCard(
                 item_id=item_id, section=section, category="DSA Follow-ups",
                 front=f"Problem: {f['problem']}",
                 back=f.get("short_answer") or f"Follow-up: {f['follow_up']}"
@@ -255,83 +505,73 @@ class ContentLoader:
     def _index_resume_screening(self):
         quiz = self._data.get("interview_viva_questions", {}).get("resume_screening_ml_quiz", {})
         section = "resume_screening"
+        prefix = section + ":"
         total = sum(len(v) for v in quiz.values())
         self._add_section(section, "Resume Screening Quiz", "ML quiz questions from resume screening rounds", total)
         for category, questions in quiz.items():
+            group_prefix = prefix + category + ":"
+            pretty = self._pretty(category)
+            fallback = f"Category: {pretty}\nPrepare a detailed answer for this question."
             for i, q in enumerate(questions):
-                item_id = f"{section}:{category}:{i}"
-                if isinstance(q, dict):
-                    title = q.get("question", str(q))
-                    short_ans = q.get("short_answer")
-                    detailed_ans = q.get("detailed_answer")
-                else:
-                    title = str(q)
-                    short_ans = None
-                    detailed_ans = None
-                self._add_item(section, ContentItem(
+                item_id = group_prefix + str(i)
+                title, short_ans, detailed_ans = _norm(q, "question")
+                self._add_item(section, _ContentItem(
                     item_id=item_id, section=section,
-                    title=title, subtitle=category.replace("_", " ").title(),
+                    title=title, subtitle=pretty,
                     short_answer=short_ans, detailed_answer=detailed_ans
-                ))
-                self._add_flashcard(section, FlashCard(
-                    item_id=item_id, section=section, category=category.replace("_", " ").title(),
+                ), sub_key=category)
+                self._add_flashcard(section, _FlashCard(
+                    item_id=item_id, section=section, category=pretty,
                     front=title,
-                    back=short_ans or f"Category: {category.replace('_', ' ').title()}\nPrepare a detailed answer for this question."
+                    back=short_ans or fallback
                 ))
 
     def _index_general_topic_questions(self):
         topics = self._data.get("interview_viva_questions", {}).get("general_topic_questions", {})
         section = "general_topics"
+        prefix = section + ":"
         total = sum(len(v) for v in topics.values())
         self._add_section(section, "General Topic Questions", "Interview questions across all major topics", total)
         for topic, questions in topics.items():
+            group_prefix = prefix + topic + ":"
+            pretty = self._pretty(topic)
+            fallback = f"Topic: {pretty}\nPrepare a structured answer."
             for i, q in enumerate(questions):
-                item_id = f"{section}:{topic}:{i}"
-                if isinstance(q, dict):
-                    title = q.get("question", str(q))
-                    short_ans = q.get("short_answer")
-                    detailed_ans = q.get("detailed_answer")
-                else:
-                    title = str(q)
-                    short_ans = None
-                    detailed_ans = None
-                self._add_item(section, ContentItem(
+                item_id = group_prefix + str(i)
+                title, short_ans, detailed_ans = _norm(q, "question")
+                self._add_item(section, _ContentItem(
                     item_id=item_id, section=section,
-                    title=title, subtitle=topic.replace("_", " ").title(),
+                    title=title, subtitle=pretty,
                     short_answer=short_ans, detailed_answer=detailed_ans
-                ))
-                self._add_flashcard(section, FlashCard(
+                ), sub_key=topic)
+                self._add_flashcard(section, _FlashCard(
                     item_id=item_id, section=section,
-                    category=topic.replace("_", " ").title(),
+                    category=pretty,
                     front=title,
-                    back=short_ans or f"Topic: {topic.replace('_', ' ').title()}\nPrepare a structured answer."
+                    back=short_ans or fallback
                 ))
 
     def _index_python_competencies(self):
         competencies = self._data.get("python_senior_competencies", {})
         section = "python_competencies"
+        prefix = section + ":"
         total = sum(len(v) for v in competencies.values())
         self._add_section(section, "Python Senior Competencies", "Skills expected from a Senior Python engineer", total)
         for area, skills in competencies.items():
+            group_prefix = prefix + area + ":"
+            pretty = self._pretty(area)
             for i, skill in enumerate(skills):
-                item_id = f"{section}:{area}:{i}"
-                if isinstance(skill, dict):
-                    title = skill.get("topic", str(skill))
-                    short_ans = skill.get("short_answer")
-                    detailed_ans = skill.get("detailed_answer")
-                else:
-                    title = str(skill)
-                    short_ans = None
-                    detailed_ans = None
-                self._add_item(section, ContentItem(
+                item_id = group_prefix + str(i)
+                title, short_ans, detailed_ans = _norm(skill, "topic")
+                self._add_item(section, _ContentItem(
                     item_id=item_id, section=section,
-                    title=title, subtitle=area.replace("_", " ").title(),
+                    title=title, subtitle=pretty,
                     short_answer=short_ans, detailed_answer=detailed_ans
-                ))
+                ), sub_key=area)
                 front = title.split(":")[0].strip() if ":" in title else title
-                self._add_flashcard(section, FlashCard(
+                self._add_flashcard(section, _FlashCard(
                     item_id=item_id, section=section,
-                    category=area.replace("_", " ").title(),
+                    category=pretty,
                     front=front,
                     back=short_ans or title
                 ))
@@ -339,19 +579,23 @@ class ContentLoader:
     def _index_ai_maturity_levels(self):
         levels = self._data.get("ai_engineering_maturity_levels", {})
         section = "ai_maturity"
+        prefix = section + ":"
         total = sum(len(v.get("skills", [])) for v in levels.values())
         self._add_section(section, "AI Engineering Maturity", "4-level progression from using to optimizing AI", total)
         for level_key, level_data in levels.items():
+            group_prefix = prefix + level_key + ":"
             focus = level_data.get("focus", "")
+            subtitle = f"{self._pretty(level_key)} — {focus}"
+            category = f"Level: {focus}"
             for i, skill in enumerate(level_data.get("skills", [])):
-                item_id = f"{section}:{level_key}:{i}"
-                self._add_item(section, ContentItem(
+                item_id = group_prefix + str(i)
+                self._add_item(section, _ContentItem(
                     item_id=item_id, section=section,
-                    title=skill, subtitle=f"{level_key.replace('_', ' ').title()} — {focus}"
-                ))
-                self._add_flashcard(section, FlashCard(
+                    title=skill, subtitle=subtitle
+                ), sub_key=level_key)
+                self._add_flashcard(section, _FlashCard(
                     item_id=item_id, section=section,
-                    category=f"Level: {focus}",
+                    category=category,
                     front=skill,
                     back=f"Maturity Level: {focus}\nSkill: {skill}"
                 ))
@@ -360,6 +604,22 @@ class ContentLoader:
         plan = self._data.get("study_plan_14_day_sprint", {})
         self._study_plan = plan
 
+    # Registry run by _index_all; the order here is the order sections are listed in
+    _INDEXERS = (
+        _index_research_papers,  # Research Papers
+        _index_modern_llm_engineering,  # Core Concepts - Modern LLM Engineering
+        _index_key_2026_topics,  # Core Concepts - Key 2026 Topics
+        _index_dsa_design_mapping,  # System Design - DSA to Design Mapping
+        _index_hld_scenarios,  # System Design - HLD Scenarios
+        _index_amazon_criteria,  # System Design - Amazon Evaluation Criteria
+        _index_hard_dsa_followups,  # System Design - Hard DSA Follow-ups
+        _index_resume_screening,  # Interview Viva - Resume Screening ML Quiz
+        _index_general_topic_questions,  # Interview Viva - General Topic Questions
+        _index_python_competencies,  # Python Senior Competencies
+        _index_ai_maturity_levels,  # AI Engineering Maturity Levels
+        _index_study_plan,  # Study Plan
+    )
+
     # ─── Interview Questions Grouped by Category ───────────────
 
     CATEGORY_MAP = {
@@ -395,8 +655,12 @@ class ContentLoader:
         },
     }
 
-    def get_interview_questions(self) -> list[InterviewCategory]:
+    def get_interview_questions(self) -> tuple[InterviewCategory, ...]:
         """Return all items that have short_answer/detailed_answer, grouped by user-facing categories."""
+        return self._interview_questions
+
+    def _build_interview_questions(self):
+        """Group answered items by CATEGORY_MAP once, after indexing."""
         categories: list[InterviewCategory] = []
 
         for cat_name, subcats in self.CATEGORY_MAP.items():
@@ -404,21 +668,20 @@ class ContentLoader:
             for subcat_name, sources in subcats.items():
                 items: list[ContentItem] = []
                 for section_key, sub_key in sources:
-                    section_items = self._items.get(section_key, [])
-                    for item in section_items:
-                        # Filter by sub_key if specified (subcategory embedded in item_id)
-                        if sub_key:
-                            if f":{sub_key}:" not in item.item_id:
-                                continue
+                    if sub_key is None:
+                        source_items = self._items.get(section_key, ())
+                    else:
+                        source_items = self._items_by_subkey.get((section_key, sub_key), ())
+                    for item in source_items:
                         # Only include items with at least one answer
                         if item.short_answer or item.detailed_answer:
-                            items.append(item)
+                            items.append(ContentItem.model_validate(item, from_attributes=True))
                 if items:
-                    sub_list.append(InterviewSubcategory(name=subcat_name, items=items))
+                    sub_list.append(InterviewSubcategory.model_construct(name=subcat_name, items=items))
             if sub_list:
-                categories.append(InterviewCategory(category=cat_name, subcategories=sub_list))
+                categories.append(InterviewCategory.model_construct(category=cat_name, subcategories=sub_list))
 
-        return categories
+        self._interview_questions = tuple(categories)
 
 
 # Singleton instance
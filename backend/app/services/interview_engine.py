@@ -4,25 +4,30 @@ Builds system prompts from genai.json content, manages conversation flow,
 generates follow-up questions, and produces evaluation reports.
 """
 
-import json
-import uuid
+import asyncio
+import secrets
+import time
 from datetime import datetime
+from functools import lru_cache
+from typing import Any, AsyncIterator
+import orjson
 from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
+from langchain_core.utils.json import parse_partial_json
 
+from app.config import settings
 from app.schemas.schemas import LLMConfig, InterviewEvaluation
 from app.services.content_loader import content_loader
-from app.services.llm_service import get_llm
+from app.services.llm_cache import evaluation_cache
+from app.services.llm_service import cached_system_message, extract_json_payload, get_llm
+from app.services.session_store import SessionStore
 
 
 # In-memory session store (for active sessions)
-_sessions: dict[str, dict] = {}
+_sessions = SessionStore(maxsize=settings.MAX_INTERVIEW_SESSIONS, ttl=settings.INTERVIEW_SESSION_TTL)
 
 
-def _build_system_prompt(interview_type: str, difficulty: str, num_questions: int) -> str:
-    """Build a tailored system prompt for the interview type."""
-    base = f"""You are a senior technical interviewer at a top-tier tech company (FAANG level).
-You are conducting a {difficulty}-level mock interview for a Senior Python GenAI Engineer position.
-You will ask {num_questions} questions total, one at a time.
+_INTERVIEWER_RULES = """You are a senior technical interviewer at a top-tier tech company (FAANG level).
+You are conducting a mock interview for a Senior Python GenAI Engineer position.
 
 Interview rules:
 1. Ask ONE question at a time and wait for the candidate's response.
@@ -30,52 +35,100 @@ Interview rules:
 3. Start with a brief introduction and your first question.
 4. Probe deeper when answers are surface-level — ask "why?", "how would you handle X?", "what are the tradeoffs?"
 5. Be encouraging but honest. Point out gaps when you see them.
-6. Keep track of the question number (e.g., "Question 2 of {num_questions}").
+6. Keep track of the question number (e.g., "Question N of M").
 7. When all questions are done, say "INTERVIEW_COMPLETE" and provide nothing else.
 """
 
-    # Add topic-specific context from genai.json
+
+@lru_cache(maxsize=8)
+def _build_reference_block(interview_type: str, content_version: int) -> str:
+    """Build the stable part of the system prompt: rules plus reference material.
+
+    It depends only on the interview type (and loaded content version) and comes
+    first in the prompt, so providers' prefix caches can reuse it across sessions.
+    """
+    # Add topic-specific context from genai.json, in the loader's stable prompt order
     context_parts = []
 
     if interview_type in ("python", "mixed"):
-        competencies = content_loader.get_items("python_competencies")
+        competencies = content_loader.get_prompt_items("python_competencies")
         if competencies:
             context_parts.append("Python topics to draw from:\n" + "\n".join(f"- {c.title}" for c in competencies[:10]))
 
     if interview_type in ("system_design", "mixed"):
-        scenarios = content_loader.get_items("hld_scenarios")
+        scenarios = content_loader.get_prompt_items("hld_scenarios")
         if scenarios:
             context_parts.append("System Design scenarios:\n" + "\n".join(f"- {s.title}" for s in scenarios[:5]))
-        dsa = content_loader.get_items("dsa_design_mapping")
+        dsa = content_loader.get_prompt_items("dsa_design_mapping")
         if dsa:
             context_parts.append("DSA → Design mappings:\n" + "\n".join(f"- {d.title} → {d.detail}" for d in dsa[:10]))
 
     if interview_type in ("genai", "mixed"):
-        llm_concepts = content_loader.get_items("modern_llm_engineering")
+        llm_concepts = content_loader.get_prompt_items("modern_llm_engineering")
         if llm_concepts:
             context_parts.append("GenAI/LLM topics:\n" + "\n".join(f"- {c.title}" for c in llm_concepts[:10]))
-        topics = content_loader.get_items("key_2026_topics")
+        topics = content_loader.get_prompt_items("key_2026_topics")
         if topics:
             context_parts.append("Key 2026 topics:\n" + "\n".join(f"- {t.title}: {t.detail}" for t in topics))
 
     if interview_type in ("ml_dl", "mixed"):
-        ml_questions = content_loader.get_items("resume_screening")
+        ml_questions = content_loader.get_prompt_items("resume_screening")
         if ml_questions:
             context_parts.append("ML/DL questions:\n" + "\n".join(f"- {q.title}" for q in ml_questions[:10]))
-        general = content_loader.get_items("general_topics")
+        general = content_loader.get_prompt_items("general_topics")
         if general:
             context_parts.append("General topic questions:\n" + "\n".join(f"- {g.title}" for g in general[:10]))
 
+    block = _INTERVIEWER_RULES
     if context_parts:
-        base += "\n\nReference material for your questions:\n" + "\n\n".join(context_parts)
+        block += "\n\nReference material for your questions:\n" + "\n\n".join(context_parts)
+    return block
+
+
+@lru_cache(maxsize=64)
+def _build_system_prompt_parts(
+    interview_type: str, difficulty: str, num_questions: int, content_version: int
+) -> tuple[str, str]:
+    """(cacheable prefix, per-session tail) of the interviewer system prompt.
+
+    content_version is content_loader.version, so a reload builds fresh prompts.
+    """
+    return (
+        _build_reference_block(interview_type, content_version),
+        _build_session_details(difficulty, num_questions),
+    )
+
+
+def _build_session_details(difficulty: str, num_questions: int) -> str:
+    """Build the small per-session tail of the system prompt."""
+    return (
+        f"\n\nThis session: a {difficulty}-level interview. "
+        f"You will ask {num_questions} questions total, one at a time "
+        f'(e.g., "Question 2 of {num_questions}").'
+    )
+
+
+def _system_message(session: dict, llm_config: LLMConfig) -> SystemMessage:
+    """System message for a session, marking the stable prefix cacheable on Anthropic."""
+    return cached_system_message(session["system_prefix"], session["system_suffix"], llm_config)
+
+
+def _to_lc_messages(session: dict, llm_config: LLMConfig) -> list:
+    """Prompt for the next interviewer turn: system message plus the conversation so far.
 
-    return base
+    The conversation is kept in LangChain form as it grows, so this only
+    prepends the system message instead of translating every stored message.
+    """
+    return [_system_message(session, llm_config), *session["lc_messages"]]
 
 
 def create_session(interview_type: str, difficulty: str, num_questions: int) -> dict:
     """Create a new interview session."""
-    session_id = f"int_{uuid.uuid4().hex[:12]}"
-    system_prompt = _build_system_prompt(interview_type, difficulty, num_questions)
+    session_id = "int_" + secrets.token_urlsafe(9)
+    system_prefix, system_suffix = _build_system_prompt_parts(
+        interview_type, difficulty, num_questions, content_loader.version
+    )
+    system_prompt = system_prefix + system_suffix
 
     session = {
         "session_id": session_id,
@@ -83,11 +136,19 @@ def create_session(interview_type: str, difficulty: str, num_questions: int) ->
         "difficulty": difficulty,
         "num_questions": num_questions,
         "system_prompt": system_prompt,
+        "system_prefix": system_prefix,
+        "system_suffix": system_suffix,
         "messages": [{"role": "system", "content": system_prompt}],
+        # LangChain form of the conversation after the system prompt, grown per turn
+        "lc_messages": [],
+        # Evaluation transcript of the same conversation, also grown per turn
+        "transcript": "",
         "status": "active",
+        # Serializes turns, so a repeated submit can't interleave two LLM calls
+        "lock": asyncio.Lock(),
         "created_at": datetime.utcnow().isoformat(),
     }
-    _sessions[session_id] = session
+    _sessions.set(session_id, session)
     return session
 
 
@@ -95,6 +156,10 @@ def get_session(session_id: str) -> dict | None:
     return _sessions.get(session_id)
 
 
+_LC_MESSAGE_TYPES = {"candidate": HumanMessage, "interviewer": AIMessage}
+_TRANSCRIPT_LABELS = {"candidate": "Candidate", "interviewer": "Interviewer"}
+
+
 def add_message(session_id: str, role: str, content: str):
     session = _sessions.get(session_id)
     if session:
@@ -103,6 +168,11 @@ def add_message(session_id: str, role: str, content: str):
             "content": content,
             "timestamp": datetime.utcnow().isoformat()
         })
+        message_type = _LC_MESSAGE_TYPES.get(role)
+        if message_type is not None:
+            session["lc_messages"].append(message_type(content=content))
+            separator = "\n\n" if session["transcript"] else ""
+            session["transcript"] += f"{separator}{_TRANSCRIPT_LABELS[role]}: {content}"
 
 
 async def get_interviewer_response(session_id: str, candidate_message: str, llm_config: LLMConfig) -> str:
@@ -111,65 +181,95 @@ async def get_interviewer_response(session_id: str, candidate_message: str, llm_
     if not session:
         raise ValueError(f"Session {session_id} not found")
 
-    # Add candidate message
-    add_message(session_id, "candidate", candidate_message)
+    async with session["lock"]:
+        # Add candidate message
+        add_message(session_id, "candidate", candidate_message)
+
+        lc_messages = _to_lc_messages(session, llm_config)
+
+        llm = get_llm(llm_config, streaming=False)
+        response = await llm.ainvoke(lc_messages)
+
+        # Add interviewer response
+        add_message(session_id, "interviewer", response.content)
 
-    # Build LangChain messages
-    lc_messages = []
-    for msg in session["messages"]:
-        if msg["role"] == "system":
-            lc_messages.append(SystemMessage(content=msg["content"]))
-        elif msg["role"] == "candidate":
-            lc_messages.append(HumanMessage(content=msg["content"]))
-        elif msg["role"] == "interviewer":
-            lc_messages.append(AIMessage(content=msg["content"]))
+        # Check if interview is complete
+        if "INTERVIEW_COMPLETE" in response.content:
+            session["status"] = "completed"
 
-    llm = get_llm(llm_config, streaming=False)
-    response = await llm.ainvoke(lc_messages)
+        return response.content
 
-    # Add interviewer response
-    add_message(session_id, "interviewer", response.content)
 
-    # Check if interview is complete
-    if "INTERVIEW_COMPLETE" in response.content:
-        session["status"] = "completed"
+async def _batched_tokens(chunks: AsyncIterator) -> AsyncIterator[str]:
+    """Join streamed tokens into larger pieces to cut per-token SSE frames.
 
-    return response.content
+    A piece is sent once it holds SSE_BATCH_TOKENS tokens or SSE_BATCH_MS has
+    passed since the previous send, whichever comes first — also while the
+    model is paused between tokens.
+    """
+    interval = settings.SSE_BATCH_MS / 1000
+    buffer: list[str] = []
+    last_flush = time.monotonic()
+    stream = aiter(chunks)
+    # The pending read survives a flush; cancelling it would abort the model stream
+    pending: asyncio.Future | None = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(anext(stream))
+            timeout = max(0.0, last_flush + interval - time.monotonic()) if buffer else None
+            done, _ = await asyncio.wait((pending,), timeout=timeout)
+            if not done:
+                yield "".join(buffer)
+                buffer.clear()
+                last_flush = time.monotonic()
+                continue
+            future, pending = pending, None
+            try:
+                chunk = future.result()
+            except StopAsyncIteration:
+                break
+            if not chunk.content:
+                continue
+            buffer.append(chunk.content)
+            now = time.monotonic()
+            if len(buffer) >= settings.SSE_BATCH_TOKENS or now - last_flush >= interval:
+                yield "".join(buffer)
+                buffer.clear()
+                last_flush = now
+    finally:
+        if pending is not None:
+            pending.cancel()
+            await asyncio.gather(pending, return_exceptions=True)
+    if buffer:
+        yield "".join(buffer)
 
 
 async def stream_interviewer_response(session_id: str, candidate_message: str, llm_config: LLMConfig):
-    """Stream the interviewer's response token by token."""
+    """Stream the interviewer's response in small batches of tokens."""
     session = _sessions.get(session_id)
     if not session:
         raise ValueError(f"Session {session_id} not found")
 
-    # Add candidate message
-    add_message(session_id, "candidate", candidate_message)
+    async with session["lock"]:
+        # Add candidate message
+        add_message(session_id, "candidate", candidate_message)
 
-    # Build LangChain messages
-    lc_messages = []
-    for msg in session["messages"]:
-        if msg["role"] == "system":
-            lc_messages.append(SystemMessage(content=msg["content"]))
-        elif msg["role"] == "candidate":
-            lc_messages.append(HumanMessage(content=msg["content"]))
-        elif msg["role"] == "interviewer":
-            lc_messages.append(AIMessage(content=msg["content"]))
+        lc_messages = _to_lc_messages(session, llm_config)
 
-    llm = get_llm(llm_config, streaming=True)
-    full_response = ""
+        llm = get_llm(llm_config, streaming=True)
+        parts = []
 
-    async for chunk in llm.astream(lc_messages):
-        token = chunk.content
-        if token:
-            full_response += token
-            yield token
+        async for text in _batched_tokens(llm.astream(lc_messages)):
+            parts.append(text)
+            yield text
+        full_response = "".join(parts)
 
-    # Store complete response
-    add_message(session_id, "interviewer", full_response)
+        # Store complete response
+        add_message(session_id, "interviewer", full_response)
 
-    if "INTERVIEW_COMPLETE" in full_response:
-        session["status"] = "completed"
+        if "INTERVIEW_COMPLETE" in full_response:
+            session["status"] = "completed"
 
 
 async def start_interview(session_id: str, llm_config: LLMConfig) -> str:
@@ -178,12 +278,13 @@ async def start_interview(session_id: str, llm_config: LLMConfig) -> str:
     if not session:
         raise ValueError(f"Session {session_id} not found")
 
-    lc_messages = [SystemMessage(content=session["system_prompt"])]
-    llm = get_llm(llm_config, streaming=False)
-    response = await llm.ainvoke(lc_messages)
+    async with session["lock"]:
+        lc_messages = _to_lc_messages(session, llm_config)
+        llm = get_llm(llm_config, streaming=False)
+        response = await llm.ainvoke(lc_messages)
 
-    add_message(session_id, "interviewer", response.content)
-    return response.content
+        add_message(session_id, "interviewer", response.content)
+        return response.content
 
 
 async def stream_start_interview(session_id: str, llm_config: LLMConfig):
@@ -192,35 +293,30 @@ async def stream_start_interview(session_id: str, llm_config: LLMConfig):
     if not session:
         raise ValueError(f"Session {session_id} not found")
 
-    lc_messages = [SystemMessage(content=session["system_prompt"])]
-    llm = get_llm(llm_config, streaming=True)
-    full_response = ""
+    async with session["lock"]:
+        lc_messages = _to_lc_messages(session, llm_config)
+        llm = get_llm(llm_config, streaming=True)
+        parts = []
 
-    async for chunk in llm.astream(lc_messages):
-        token = chunk.content
-        if token:
-            full_response += token
-            yield token
+        async for text in _batched_tokens(llm.astream(lc_messages)):
+            parts.append(text)
+            yield text
+        full_response = "".join(parts)
 
-    add_message(session_id, "interviewer", full_response)
+        add_message(session_id, "interviewer", full_response)
 
 
-async def evaluate_interview(session_id: str, llm_config: LLMConfig) -> InterviewEvaluation:
-    """Generate an evaluation report for the completed interview."""
-    session = _sessions.get(session_id)
-    if not session:
-        raise ValueError(f"Session {session_id} not found")
+_EVALUATOR_PROMPT = "You are a technical interview evaluator. Return only valid JSON."
+
+# Minimum time between partial parses of a streamed evaluation
+_PARTIAL_PARSE_INTERVAL = 0.05
+
 
-    # Build conversation transcript (exclude system prompt)
-    transcript_parts = []
-    for msg in session["messages"]:
-        if msg["role"] == "system":
-            continue
-        role = "Interviewer" if msg["role"] == "interviewer" else "Candidate"
-        transcript_parts.append(f"{role}: {msg['content']}")
-    transcript = "\n\n".join(transcript_parts)
+def _build_evaluation_prompt(session: dict) -> str:
+    # The transcript (system prompt excluded) is kept up to date by add_message
+    transcript = session["transcript"]
 
-    eval_prompt = f"""You are evaluating a mock technical interview for a Senior Python GenAI Engineer position.
+    return f"""You are evaluating a mock technical interview for a Senior Python GenAI Engineer position.
 Interview type: {session['interview_type']}
 Difficulty: {session['difficulty']}
 
@@ -239,22 +335,69 @@ Evaluate the candidate and return ONLY valid JSON with this exact structure:
 }}
 """
 
-    llm = get_llm(llm_config, streaming=False)
-    response = await llm.ainvoke([
-        SystemMessage(content="You are a technical interview evaluator. Return only valid JSON."),
-        HumanMessage(content=eval_prompt),
-    ])
+
+def _parse_evaluation(raw_content: str) -> InterviewEvaluation:
+    data = orjson.loads(extract_json_payload(raw_content))
+    return InterviewEvaluation(**data)
+
+
+def _completed_fields(buffer: str, emitted: set[str]) -> list[tuple[str, Any]]:
+    """Fields of a partially streamed JSON object that can no longer change.
+
+    Every key except the last one present is complete, since the model has
+    already moved on to the next key.
+    """
+    start = buffer.find("{")
+    if start < 0:
+        return []
+    partial = parse_partial_json(buffer[start:])
+    if not isinstance(partial, dict):
+        return []
+    keys = list(partial)[:-1]
+    return [(k, partial[k]) for k in keys if k not in emitted]
+
+
+async def stream_evaluate_interview(
+    session_id: str, llm_config: LLMConfig
+) -> AsyncIterator[tuple[str, Any]]:
+    """Stream an evaluation report as (field, value) pairs as each field completes.
+
+    The last pair is ("evaluation", InterviewEvaluation) with the full, validated report.
+    """
+    session = _sessions.get(session_id)
+    if not session:
+        raise ValueError(f"Session {session_id} not found")
+
+    eval_prompt = _build_evaluation_prompt(session)
+    cache_key = evaluation_cache.key(llm_config, _EVALUATOR_PROMPT, eval_prompt)
+    raw_content = evaluation_cache.get(cache_key)
+
+    if raw_content is None:
+        llm = get_llm(llm_config, streaming=True)
+        chunks: list[str] = []
+        emitted: set[str] = set()
+        last_parse = time.monotonic()
+        async for chunk in llm.astream([
+            SystemMessage(content=_EVALUATOR_PROMPT),
+            HumanMessage(content=eval_prompt),
+        ]):
+            if chunk.content:
+                chunks.append(chunk.content)
+            # Re-parse the growing buffer at most once per interval, not per token
+            now = time.monotonic()
+            if now - last_parse < _PARTIAL_PARSE_INTERVAL:
+                continue
+            last_parse = now
+            for field, value in _completed_fields("".join(chunks), emitted):
+                emitted.add(field)
+                yield field, value
+        raw_content = "".join(chunks)
 
     try:
-        content = response.content
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0]
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0]
-        data = json.loads(content.strip())
-        return InterviewEvaluation(**data)
+        evaluation = _parse_evaluation(raw_content)
+        evaluation_cache.put(cache_key, raw_content)
     except Exception:
-        return InterviewEvaluation(
+        evaluation = InterviewEvaluation(
             overall_score=0,
             correctness=0,
             depth=0,
@@ -263,6 +406,16 @@ Evaluate the candidate and return ONLY valid JSON with this exact structure:
             areas_to_improve=["Please try again"],
             recommendations=["Retry the evaluation"],
         )
+    yield "evaluation", evaluation
+
+
+async def evaluate_interview(session_id: str, llm_config: LLMConfig) -> InterviewEvaluation:
+    """Generate an evaluation report for the completed interview."""
+    evaluation = None
+    async for field, value in stream_evaluate_interview(session_id, llm_config):
+        if field == "evaluation":
+            evaluation = value
+    return evaluation
 
 
 def get_session_messages(session_id: str) -> list[dict]:
@@ -275,4 +428,4 @@ def get_session_messages(session_id: str) -> list[dict]:
 
 def cleanup_session(session_id: str):
     """Remove a session from memory."""
-    _sessions.pop(session_id, None)
+    _sessions.pop(session_id)
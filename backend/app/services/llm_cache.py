@@ -0,0 +1,54 @@
+"""
+LLM response cache — exact-match, in-process cache for LLM completions.
+
+Keys are SHA-256 digests over the prompts and the model settings, so an
+identical request to the same model is answered without a provider round-trip.
+Entries expire after a TTL and the least recently used ones are evicted first.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+
+from app.schemas.schemas import LLMConfig
+from app.services.llm_service import DEFAULT_MODELS, DEFAULT_TEMPERATURE
+
+
+class ResponseCache:
+    def __init__(self, maxsize: int = 256, ttl: float = 3600.0):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    @staticmethod
+    def key(llm_config: LLMConfig, *prompts: str) -> str:
+        """Digest of the prompts plus everything that changes the model's answer."""
+        provider = llm_config.provider.lower()
+        model = llm_config.model or DEFAULT_MODELS.get(provider, "")
+        h = hashlib.sha256()
+        for part in (provider, model, llm_config.base_url or "", str(DEFAULT_TEMPERATURE), *prompts):
+            h.update(part.encode())
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def get(self, key: str) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: str) -> None:
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+
+# Raw completions, stored only once they parsed successfully
+quiz_cache = ResponseCache()
+evaluation_cache = ResponseCache()
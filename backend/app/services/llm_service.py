@@ -4,7 +4,11 @@ Supports: Google Gemini, OpenAI, Anthropic, Ollama.
 Provider + model + API key passed per-request — backend is stateless.
 """
 
+import re
+from functools import lru_cache
+
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import SystemMessage
 from app.schemas.schemas import LLMConfig
 
 
@@ -15,49 +19,83 @@ DEFAULT_MODELS = {
     "ollama": "llama3.2",
 }
 
+DEFAULT_TEMPERATURE = 0.7
+
+_CODE_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.S)
+
 
 def get_llm(config: LLMConfig, streaming: bool = False) -> BaseChatModel:
-    """Create a LangChain chat model from the provided config."""
+    """Return a LangChain chat model for the provided config.
+
+    Models are reused across requests with the same settings, so their HTTP
+    clients keep connections alive instead of reconnecting on every call.
+    """
     provider = config.provider.lower()
     model = config.model or DEFAULT_MODELS.get(provider, "")
+    return _build_llm(provider, model, config.api_key, config.base_url, streaming)
+
 
+@lru_cache(maxsize=32)
+def _build_llm(
+    provider: str, model: str, api_key: str | None, base_url: str | None, streaming: bool
+) -> BaseChatModel:
     if provider == "gemini":
         from langchain_google_genai import ChatGoogleGenerativeAI
         return ChatGoogleGenerativeAI(
             model=model,
-            google_api_key=config.api_key,
+            google_api_key=api_key,
             streaming=streaming,
-            temperature=0.7,
+            temperature=DEFAULT_TEMPERATURE,
         )
     elif provider == "openai":
         from langchain_openai import ChatOpenAI
         return ChatOpenAI(
             model=model,
-            api_key=config.api_key,
+            api_key=api_key,
             streaming=streaming,
-            temperature=0.7,
+            temperature=DEFAULT_TEMPERATURE,
         )
     elif provider == "anthropic":
         from langchain_anthropic import ChatAnthropic
         return ChatAnthropic(
             model=model,
-            api_key=config.api_key,
+            api_key=api_key,
             streaming=streaming,
-            temperature=0.7,
+            temperature=DEFAULT_TEMPERATURE,
         )
     elif provider == "ollama":
         from langchain_ollama import ChatOllama
-        base_url = config.base_url or "http://localhost:11434"
+        base_url = base_url or "http://localhost:11434"
         return ChatOllama(
             model=model,
             base_url=base_url,
             streaming=streaming,
-            temperature=0.7,
+            temperature=DEFAULT_TEMPERATURE,
         )
     else:
         raise ValueError(f"Unsupported LLM provider: {provider}")
 
 
+def cached_system_message(prefix: str, suffix: str, config: LLMConfig) -> SystemMessage:
+    """System message whose stable prefix is marked cacheable on Anthropic.
+
+    OpenAI and Gemini cache byte-identical prompt prefixes automatically, so
+    other providers get the plain concatenated prompt.
+    """
+    if config.provider.lower() != "anthropic":
+        return SystemMessage(content=prefix + suffix)
+    return SystemMessage(content=[
+        {"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": suffix},
+    ])
+
+
+def extract_json_payload(content: str) -> str:
+    """Return the JSON text of an LLM reply, unwrapping a markdown code fence if present."""
+    match = _CODE_FENCE_RE.search(content)
+    return (match.group(1) if match else content).strip()
+
+
 async def test_connection(config: LLMConfig) -> dict:
     """Test LLM connection with a simple ping."""
     try:
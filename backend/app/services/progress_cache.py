@@ -0,0 +1,57 @@
+"""
+Progress cache — in-process cache for responses derived from the progress table.
+
+Entries are tagged with a version counter that every progress write bumps, once
+when the write is issued and again when its transaction commits, so a payload
+computed from uncommitted or outdated rows is never served afterwards.
+"""
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+_DIRTY_KEY = "progress_dirty"
+
+_version = 0
+_entries: dict[str, tuple[int, bytes]] = {}
+
+
+def current_version() -> int:
+    return _version
+
+
+def get(key: str) -> bytes | None:
+    """Return the cached payload for key if it was stored at the current version."""
+    entry = _entries.get(key)
+    if entry is not None and entry[0] == _version:
+        return entry[1]
+    return None
+
+
+def put(key: str, version: int, payload: bytes) -> None:
+    """Store a payload computed at `version`; dropped if a write happened meanwhile."""
+    if version == _version:
+        _entries[key] = (version, payload)
+
+
+def invalidate(db: AsyncSession) -> None:
+    """Mark progress as changed by this session; call after issuing a write."""
+    _bump()
+    db.sync_session.info[_DIRTY_KEY] = True
+
+
+def _bump() -> None:
+    global _version
+    _version += 1
+    _entries.clear()
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session: Session) -> None:
+    if session.info.pop(_DIRTY_KEY, False):
+        _bump()
+
+
+@event.listens_for(Session, "after_rollback")
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_DIRTY_KEY, None)
@@ -5,14 +5,23 @@ Two modes:
   - ai: LLM-generated contextual questions via LangChain
 """
 
+import asyncio
+import math
 import random
-import json
-import uuid
-from langchain_core.messages import SystemMessage, HumanMessage
+import secrets
+import time
+from collections.abc import AsyncIterator, Sequence
+from contextlib import aclosing
+from functools import lru_cache
+import orjson
+from langchain_core.messages import HumanMessage
+from langchain_core.utils.json import parse_partial_json
 
+from app.config import settings
 from app.schemas.schemas import QuizQuestion, LLMConfig
 from app.services.content_loader import content_loader
-from app.services.llm_service import get_llm
+from app.services.llm_cache import quiz_cache
+from app.services.llm_service import cached_system_message, extract_json_payload, get_llm
 
 
 def generate_static_quiz(section: str, count: int = 5, topic: str | None = None) -> list[QuizQuestion]:
@@ -27,32 +36,30 @@ def generate_static_quiz(section: str, count: int = 5, topic: str | None = None)
         if filtered:
             items = filtered
 
-    random.shuffle(items)
-    items = items[:count]
+    # sample() copies just the picked items and leaves the loader's tuple untouched
+    items = random.sample(items, min(count, len(items)))
     questions = []
 
-    all_section_items = content_loader.get_items(section)
-
     for item in items:
-        q_id = f"q_{uuid.uuid4().hex[:8]}"
+        q_id = "q_" + secrets.token_urlsafe(6)
 
         # Build MCQ based on section type
         if section == "research_papers":
             question = f"What is the topic of the paper '{item.title}'?"
             correct = item.subtitle or item.detail or ""
-            distractors = _get_distractors(correct, [i.subtitle or i.detail or "" for i in all_section_items], 3)
+            distractors = _get_distractors(correct, _distractor_pool(section, content_loader.version), 3)
             options = distractors + [correct]
             random.shuffle(options)
         elif section == "dsa_design_mapping":
             question = f"Which system design pattern is related to the DSA problem '{item.title}'?"
             correct = item.detail or ""
-            distractors = _get_distractors(correct, [i.detail or "" for i in all_section_items], 3)
+            distractors = _get_distractors(correct, _distractor_pool(section, content_loader.version), 3)
             options = distractors + [correct]
             random.shuffle(options)
         elif section == "key_2026_topics":
             question = f"What does '{item.title}' refer to in the context of GenAI?"
             correct = item.detail or ""
-            distractors = _get_distractors(correct, [i.detail or "" for i in all_section_items], 3)
+            distractors = _get_distractors(correct, _distractor_pool(section, content_loader.version), 3)
             options = distractors + [correct]
             random.shuffle(options)
         else:
@@ -75,6 +82,17 @@ def generate_static_quiz(section: str, count: int = 5, topic: str | None = None)
     return questions
 
 
+# AI quizzes above _AI_QUIZ_SINGLE_CALL_MAX questions are split into concurrent
+# batches of about _AI_QUIZ_BATCH_SIZE questions each
+_AI_QUIZ_SINGLE_CALL_MAX = 10
+_AI_QUIZ_BATCH_SIZE = 5
+_LLM_ATTEMPTS = 3
+# Minimum time between partial parses of a streamed quiz
+_PARTIAL_PARSE_INTERVAL = 0.05
+
+_llm_slots = asyncio.Semaphore(settings.MAX_CONCURRENT_LLM)
+
+
 async def generate_ai_quiz(
     section: str,
     count: int = 5,
@@ -83,19 +101,134 @@ async def generate_ai_quiz(
     llm_config: LLMConfig | None = None,
 ) -> list[QuizQuestion]:
     """Generate contextual MCQs using LLM."""
+    return [q async for q in stream_ai_quiz(section, count, difficulty, topic, llm_config)]
+
+
+async def stream_ai_quiz(
+    section: str,
+    count: int = 5,
+    difficulty: str = "medium",
+    topic: str | None = None,
+    llm_config: LLMConfig | None = None,
+) -> AsyncIterator[QuizQuestion]:
+    """Generate contextual MCQs using LLM, yielding each question as soon as the model completes it."""
     if not llm_config:
         raise ValueError("LLM config required for AI quiz generation")
 
-    items = content_loader.get_items(section)
-    context_items = items[:20]  # limit context size
-    context_str = "\n".join([f"- {i.title}: {i.detail or i.subtitle or ''}" for i in context_items])
+    # Title order keeps the context, and so the prompt prefix, stable across reloads
+    context_items = content_loader.get_prompt_items(section)[:20]  # limit context size
 
     section_info = next((s for s in content_loader.sections if s.section_key == section), None)
     section_name = section_info.title if section_info else section
 
-    system_prompt = f"""You are a technical interview quiz generator for a Senior Python GenAI Engineer position.
-Generate {count} multiple-choice questions about "{section_name}" at {difficulty} difficulty level.
-{f'Focus on the topic: {topic}' if topic else ''}
+    if count <= _AI_QUIZ_SINGLE_CALL_MAX:
+        batches = [(context_items, count)]
+    else:
+        # Each batch asks for its share of questions over a disjoint slice of the context
+        n = math.ceil(count / _AI_QUIZ_BATCH_SIZE)
+        sizes = [count // n + (i < count % n) for i in range(n)]
+        batches = [(context_items[i::n], size) for i, size in enumerate(sizes)]
+
+    produced = 0
+    seen: set[str] = set()
+    merged = _merge(
+        _stream_quiz_batch(section_name, batch_items, batch_count, difficulty, topic, llm_config)
+        for batch_items, batch_count in batches
+    )
+    # Closing explicitly runs _merge's cleanup now rather than whenever it is collected
+    async with aclosing(merged):
+        async for rq in merged:
+            # Batches run independently and may repeat each other
+            key = rq["question"].strip().lower()
+            if key in seen:
+                continue
+            seen.add(key)
+            q_id = "q_" + secrets.token_urlsafe(6)
+            yield QuizQuestion(
+                question_id=q_id,
+                **rq,
+                question_type="mcq" if rq["options"] else "open_ended",
+                section=section,
+                topic=topic,
+            )
+            produced += 1
+            if produced == count:
+                return
+
+
+async def _merge(streams) -> AsyncIterator:
+    """Interleave several async iterators, yielding items in the order they arrive.
+
+    The first failure is re-raised and the remaining iterators are cancelled.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    finished = object()
+
+    async def drain(stream):
+        try:
+            async with aclosing(stream):
+                async for value in stream:
+                    await queue.put((value, None))
+            await queue.put((finished, None))
+        except Exception as e:
+            await queue.put((finished, e))
+
+    tasks = [asyncio.create_task(drain(stream)) for stream in streams]
+    try:
+        remaining = len(tasks)
+        while remaining:
+            value, error = await queue.get()
+            if error is not None:
+                raise error
+            if value is finished:
+                remaining -= 1
+            else:
+                yield value
+    finally:
+        for task in tasks:
+            task.cancel()
+        # Let cancelled batches unwind (releasing their LLM slots) before returning
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _normalize_question(rq: dict) -> dict:
+    return {
+        "question": rq["question"],
+        "options": rq.get("options"),
+        "correct_answer": rq["correct_answer"],
+        "explanation": rq.get("explanation"),
+    }
+
+
+def _completed_elements(buffer: str) -> list:
+    """Elements of a partially streamed JSON array that can no longer change.
+
+    Every element except the last one present is complete, since the model has
+    already moved on to the next element.
+    """
+    start = buffer.find("[")
+    if start < 0:
+        return []
+    partial = parse_partial_json(buffer[start:])
+    if not isinstance(partial, list):
+        return []
+    return partial[:-1]
+
+
+async def _stream_quiz_batch(
+    section_name: str,
+    context_items: Sequence,
+    count: int,
+    difficulty: str,
+    topic: str | None,
+    llm_config: LLMConfig,
+) -> AsyncIterator[dict]:
+    """Ask the LLM for one batch of MCQs, yielding each parsed question dict as it completes."""
+    context_str = "\n".join([f"- {i.title}: {i.detail or i.subtitle or ''}" for i in context_items])
+
+    # The reference material leads so it forms a prefix shared by every request for
+    # this section; the per-request settings follow it
+    system_prefix = f"""You are a technical interview quiz generator for a Senior Python GenAI Engineer position.
 
 Context from the study material:
 {context_str}
@@ -109,47 +242,88 @@ Return ONLY a valid JSON array with this exact structure:
     "explanation": "brief explanation of why this is correct"
   }}
 ]
+"""
+    system_suffix = f"""
+Generate {count} multiple-choice questions about "{section_name}" at {difficulty} difficulty level.
+{f'Focus on the topic: {topic}' if topic else ''}
 """
 
-    llm = get_llm(llm_config, streaming=False)
-    response = await llm.ainvoke([
-        SystemMessage(content=system_prompt),
-        HumanMessage(content=f"Generate {count} {difficulty} difficulty MCQs about {section_name}."),
-    ])
+    human_prompt = f"Generate {count} {difficulty} difficulty MCQs about {section_name}."
+    cache_key = quiz_cache.key(llm_config, system_prefix, system_suffix, human_prompt)
+    raw_content = quiz_cache.get(cache_key)
+    emitted = 0
 
-    # Parse LLM response
     try:
-        content = response.content
-        # Extract JSON from markdown code blocks if present
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0]
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0]
-
-        raw_questions = json.loads(content.strip())
-        questions = []
-        for rq in raw_questions[:count]:
-            q_id = f"q_{uuid.uuid4().hex[:8]}"
-            questions.append(QuizQuestion(
-                question_id=q_id,
-                question=rq["question"],
-                options=rq.get("options"),
-                correct_answer=rq["correct_answer"],
-                explanation=rq.get("explanation"),
-                question_type="mcq" if rq.get("options") else "open_ended",
-                section=section,
-                topic=topic,
-            ))
-        return questions
-    except (json.JSONDecodeError, KeyError, IndexError) as e:
+        if raw_content is None:
+            chunks: list[str] = []
+            last_parse = time.monotonic()
+            reply = _stream_with_retry(llm_config, [
+                cached_system_message(system_prefix, system_suffix, llm_config),
+                HumanMessage(content=human_prompt),
+            ])
+            async with aclosing(reply):
+                async for text in reply:
+                    chunks.append(text)
+                    # Re-parse the growing buffer at most once per interval, not per token
+                    now = time.monotonic()
+                    if now - last_parse < _PARTIAL_PARSE_INTERVAL:
+                        continue
+                    last_parse = now
+                    for rq in _completed_elements("".join(chunks))[emitted:count]:
+                        yield _normalize_question(rq)
+                        emitted += 1
+            raw_content = "".join(chunks)
+
+        # The full reply settles the last element and anything partial parsing missed
+        for rq in orjson.loads(extract_json_payload(raw_content))[emitted:count]:
+            yield _normalize_question(rq)
+    except (orjson.JSONDecodeError, KeyError, IndexError, TypeError) as e:
         raise ValueError(f"Failed to parse LLM quiz response: {e}")
+    quiz_cache.put(cache_key, raw_content)
+
+
+async def _stream_with_retry(llm_config: LLMConfig, messages: list) -> AsyncIterator[str]:
+    """Stream the LLM reply within the shared concurrency limit.
+
+    Errors before the first token are retried with exponential backoff; once
+    text has been yielded, a failure is raised as-is.
+    """
+    llm = get_llm(llm_config, streaming=True)
+    for attempt in range(_LLM_ATTEMPTS):
+        started = False
+        try:
+            async with _llm_slots, aclosing(llm.astream(messages)) as stream:
+                async for chunk in stream:
+                    if chunk.content:
+                        started = True
+                        yield chunk.content
+            return
+        except Exception:
+            if started or attempt == _LLM_ATTEMPTS - 1:
+                raise
+            await asyncio.sleep(0.5 * 2 ** attempt)
+
+
+_GENERIC_DISTRACTORS = ("Not applicable", "None of the above", "All of the above", "Multiple correct")
+
+
+@lru_cache(maxsize=32)
+def _distractor_pool(section: str, content_version: int) -> tuple[str, ...]:
+    """Distinct candidate answers of a section, built once per loaded content version."""
+    items = content_loader.get_items(section)
+    if section == "research_papers":
+        answers = (i.subtitle or i.detail for i in items)
+    else:
+        answers = (i.detail for i in items)
+    return tuple(dict.fromkeys(filter(None, answers)))
 
 
-def _get_distractors(correct: str, all_options: list[str], count: int) -> list[str]:
+def _get_distractors(correct: str, pool: tuple[str, ...], count: int) -> list[str]:
     """Get random distractors (wrong answers) from the pool, excluding the correct answer."""
-    pool = [o for o in all_options if o and o != correct]
-    if len(pool) < count:
+    # One extra pick covers the correct answer being drawn
+    picks = random.sample(pool, min(count + 1, len(pool)))
+    distractors = [p for p in picks if p != correct][:count]
+    if len(distractors) < count:
         # Pad with generic options if not enough
-        generic = ["Not applicable", "None of the above", "All of the above", "Multiple correct"]
-        pool.extend(generic)
-    return random.sample(pool[:20], min(count, len(pool)))
+        distractors += [g for g in _GENERIC_DISTRACTORS if g != correct][:count - len(distractors)]
+    return distractors
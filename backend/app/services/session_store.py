@@ -0,0 +1,49 @@
+"""
+Session store — in-process home of active interview sessions.
+
+Sessions expire after sitting idle for a TTL and the least recently used ones
+are evicted once the store is full, so abandoned interviews don't accumulate
+in worker memory.
+"""
+
+import time
+from collections import OrderedDict
+
+
+class SessionStore:
+    def __init__(self, maxsize: int = 256, ttl: float = 3600.0):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+    def get(self, session_id: str) -> dict | None:
+        """Return a live session and extend its lifetime, or None if unknown or expired."""
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return None
+        expires_at, session = entry
+        now = time.monotonic()
+        if expires_at < now:
+            del self._entries[session_id]
+            return None
+        self._entries[session_id] = (now + self._ttl, session)
+        self._entries.move_to_end(session_id)
+        return session
+
+    def set(self, session_id: str, session: dict) -> None:
+        self._entries[session_id] = (time.monotonic() + self._ttl, session)
+        self._entries.move_to_end(session_id)
+        self._evict()
+
+    def pop(self, session_id: str) -> dict | None:
+        entry = self._entries.pop(session_id, None)
+        return entry[1] if entry else None
+
+    def _evict(self) -> None:
+        # Oldest entries sit at the front, so expired ones are dropped from there first
+        now = time.monotonic()
+        while self._entries:
+            expires_at, _ = next(iter(self._entries.values()))
+            if expires_at >= now and len(self._entries) <= self._maxsize:
+                break
+            self._entries.popitem(last=False)
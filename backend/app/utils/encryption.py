@@ -1,33 +1,68 @@
 """
 Encryption utilities for API keys stored at rest in SQLite.
-Uses Fernet symmetric encryption from the cryptography library.
+Uses AES-256-GCM from the cryptography library; values written by earlier
+versions with Fernet are still decrypted.
 """
 
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 import base64
+import functools
 import hashlib
+import os
 
 from app.config import settings
 
+# Marks AES-GCM ciphertexts; Fernet tokens never contain a colon
+_AESGCM_PREFIX = "v2:"
+_NONCE_SIZE = 12
 
+
+@functools.lru_cache(maxsize=1)
+def _derived_key() -> bytes:
+    return hashlib.sha256(settings.ENCRYPTION_KEY.encode()).digest()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_aesgcm() -> AESGCM:
+    """AES-256-GCM cipher keyed from the configured encryption key.
+
+    Settings are immutable, so the instance is built once.
+    """
+    return AESGCM(_derived_key())
+
+
+@functools.lru_cache(maxsize=1)
 def _get_fernet() -> Fernet:
-    """Derive a Fernet key from the configured encryption key."""
-    key = hashlib.sha256(settings.ENCRYPTION_KEY.encode()).digest()
-    fernet_key = base64.urlsafe_b64encode(key)
-    return Fernet(fernet_key)
+    """Fernet cipher for values encrypted before the switch to AES-GCM."""
+    return Fernet(base64.urlsafe_b64encode(_derived_key()))
 
 
 def encrypt_value(value: str) -> str:
     """Encrypt a string value and return base64-encoded ciphertext."""
     if not value:
         return ""
-    f = _get_fernet()
-    return f.encrypt(value.encode()).decode()
+    nonce = os.urandom(_NONCE_SIZE)
+    ciphertext = _get_aesgcm().encrypt(nonce, value.encode(), None)
+    return _AESGCM_PREFIX + base64.urlsafe_b64encode(nonce + ciphertext).decode()
 
 
 def decrypt_value(encrypted_value: str) -> str:
     """Decrypt a base64-encoded ciphertext and return plaintext."""
     if not encrypted_value:
         return ""
-    f = _get_fernet()
-    return f.decrypt(encrypted_value.encode()).decode()
+    return _decrypt_cached(encrypted_value)
+
+
+@functools.lru_cache(maxsize=128)
+def _decrypt_cached(encrypted_value: str) -> str:
+    # Both formats use a random nonce/IV, so a ciphertext maps to exactly one plaintext
+    if not encrypted_value.startswith(_AESGCM_PREFIX):
+        return _get_fernet().decrypt(encrypted_value.encode()).decode()
+    raw = base64.urlsafe_b64decode(encrypted_value[len(_AESGCM_PREFIX):])
+    return _get_aesgcm().decrypt(raw[:_NONCE_SIZE], raw[_NONCE_SIZE:], None).decode()
+
+
+def clear_decrypt_cache() -> None:
+    """Drop cached plaintexts, e.g. after stored keys are replaced or deleted."""
+    _decrypt_cached.cache_clear()
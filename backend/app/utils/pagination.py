@@ -0,0 +1,41 @@
+"""
+Keyset pagination — opaque cursors over a (timestamp, tie-breakers...) sort key.
+"""
+
+import base64
+from datetime import datetime
+
+from sqlalchemy import String, literal
+
+
+def _db_timestamp(ts: datetime) -> str:
+    """Format a timestamp the way SQLite stores it, so equal keys compare equal."""
+    return ts.isoformat(sep=" ", timespec="microseconds" if ts.microsecond else "seconds")
+
+
+def encode_cursor(ts: datetime, *keys: int | str) -> str:
+    """Encode the sort key of the last row on a page."""
+    raw = "|".join((_db_timestamp(ts), *map(str, keys)))
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str, *key_types: type):
+    """Decode a cursor into SQL literals for a row-value comparison.
+
+    `key_types` gives the type of each tie-breaker after the timestamp (one str
+    key by default); only the first may contain "|". The timestamp is bound as
+    a plain string: SQLite compares DateTime columns as text, and a datetime
+    bind would add microseconds the stored value lacks.
+    Raises ValueError for malformed cursors.
+    """
+    key_types = key_types or (str,)
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    ts, sep, rest = raw.partition("|")
+    keys = rest.rsplit("|", len(key_types) - 1)
+    if not sep or len(keys) != len(key_types):
+        raise ValueError("Invalid cursor")
+    datetime.fromisoformat(ts)
+    return (literal(ts, String), *(literal(t(k)) for t, k in zip(key_types, keys)))
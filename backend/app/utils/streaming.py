@@ -0,0 +1,30 @@
+"""
+Streaming helpers for list endpoints whose result sets grow with usage.
+Rows are fetched in batches with yield_per and written out as a JSON array
+as they arrive, so the full result is never materialized in memory.
+"""
+
+from typing import Any, AsyncIterator, Callable
+
+import orjson
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+
+from app.database import async_session
+
+
+async def _json_array(stmt: Select, serialize: Callable[[Any], dict], scalars: bool) -> AsyncIterator[bytes]:
+    # Uses its own session: the request-scoped one is closed before the body is sent
+    async with async_session() as session:
+        stmt = stmt.execution_options(yield_per=100)
+        result = await (session.stream_scalars(stmt) if scalars else session.stream(stmt))
+        sep = b"["
+        async for row in result:
+            yield sep + orjson.dumps(serialize(row))
+            sep = b","
+        yield b"[]" if sep == b"[" else b"]"
+
+
+def stream_json_array(stmt: Select, serialize: Callable[[Any], dict], scalars: bool = True) -> StreamingResponse:
+    """Stream the rows of `stmt` as a JSON array, serializing each with `serialize`."""
+    return StreamingResponse(_json_array(stmt, serialize, scalars), media_type="application/json")
@@ -31,17 +31,25 @@ export const quizApi = {
     api.post("/api/quiz/generate", params),
   generateAi: (params: { section: string; count?: number; topic?: string; difficulty?: string }, llmConfig: Record<string, unknown>) =>
     api.post("/api/quiz/generate-ai", { ...params, ...llmConfig }),
+  generateAiStream: (params: { section: string; count?: number; topic?: string; difficulty?: string }, llmConfig: Record<string, unknown>) => {
+    return fetch(`${API_BASE_URL}/api/quiz/generate-ai-stream`, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ request: params, llm_config: llmConfig }),
+    });
+  },
   submit: (sessionId: string, answers: Record<string, unknown>[]) =>
     api.post("/api/quiz/submit", { session_id: sessionId, answers }),
-  getHistory: () => api.get("/api/quiz/history"),
+  getHistory: (cursor?: string, limit?: number) =>
+    api.get("/api/quiz/history", { params: { cursor, limit } }),
 };
 
 // ─── Progress ─────────────────────────────────────────────────
 
 export const progressApi = {
   getOverview: () => api.get("/api/progress/overview"),
-  getItems: (section?: string, status?: string) =>
-    api.get("/api/progress/items", { params: { section, status } }),
+  getItems: (section?: string, status?: string, cursor?: string, limit?: number) =>
+    api.get("/api/progress/items", { params: { section, status, cursor, limit } }),
   getItem: (itemId: string) => api.get(`/api/progress/items/${itemId}`),
   updateItem: (data: { item_id: string; section: string; status: string; confidence: number }) =>
     api.post("/api/progress/items", data),
@@ -116,6 +124,13 @@ export const interviewApi = {
   },
   evaluate: (data: { session_id: string; llm_config: Record<string, unknown> }) =>
     api.post("/api/interview/evaluate", data),
+  evaluateStream: (data: { session_id: string; llm_config: Record<string, unknown> }) => {
+    return fetch(`${API_BASE_URL}/api/interview/evaluate-stream`, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify(data),
+    });
+  },
   listSessions: () => api.get("/api/interview/sessions"),
   getSession: (sessionId: string) => api.get(`/api/interview/sessions/${sessionId}`),
 };
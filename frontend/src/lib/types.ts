@@ -50,6 +50,11 @@ export interface Progress {
   updated_at: string;
 }
 
+export interface ProgressPage {
+  items: Progress[];
+  next_cursor: string | null;
+}
+
 export interface SectionProgress {
   section: string;
   total: number;
@@ -119,6 +124,11 @@ export interface QuizHistoryItem {
   created_at: string;
 }
 
+export interface QuizHistoryPage {
+  items: QuizHistoryItem[];
+  next_cursor: string | null;
+}
+
 // Study Plan
 export interface StudyDay {
   day: number;